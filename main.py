@@ -2,20 +2,23 @@
 """Detective Music Player - Entry point."""
 
 import sys
+from pathlib import Path
 
+from PyQt6.QtGui import QPixmapCache
 from PyQt6.QtWidgets import QApplication
 
 from player.ui.main_window import MainWindow
 
 
-DEFAULT_MUSIC_PATH = "/home/sonne/Musik/Bob Dylan/"
+DEFAULT_MUSIC_PATHS: list[Path] = [Path("/home/sonne/Musik/Bob Dylan/")]
 
 
 def main():
     app = QApplication(sys.argv)
     app.setApplicationName(" Archive")
+    QPixmapCache.setCacheLimit(20480)  # KiB; room for a few hundred scaled album covers
 
-    window = MainWindow(initial_path=DEFAULT_MUSIC_PATH)
+    window = MainWindow(initial_paths=DEFAULT_MUSIC_PATHS)
     window.show()
 
     sys.exit(app.exec())
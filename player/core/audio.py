@@ -1,11 +1,17 @@
 """VLC-based audio playback engine."""
 
 import vlc
-from PyQt6.QtCore import QObject, QTimer, pyqtSignal
+from PyQt6.QtCore import Q_ARG, QMetaObject, QObject, Qt, QThread, QTimer, pyqtSignal, pyqtSlot
 
 
 class AudioEngine(QObject):
-    """Audio playback engine wrapping python-vlc."""
+    """
+    Audio playback engine wrapping python-vlc.
+
+    The engine is meant to live on its own QThread. Playback commands
+    update the bookkeeping state immediately and queue the VLC calls to
+    the engine's thread, so the caller never blocks on libvlc.
+    """
 
     position_changed = pyqtSignal(float)  # 0.0 to 1.0
     duration_changed = pyqtSignal(int)  # milliseconds
@@ -17,63 +23,114 @@ class AudioEngine(QObject):
         self._instance = vlc.Instance("--no-xlib")
         self._player = self._instance.media_player_new()
         self._current_path: str | None = None
+        self._media: vlc.Media | None = None
         self._duration_ms: int = 0
         self._is_playing: bool = False
+        self._last_pos: float = -1.0
 
-        # Poll position every 100ms during playback
+        # Poll position every 250ms during playback (plenty for a seek bar)
         self._timer = QTimer(self)
-        self._timer.setInterval(100)
+        self._timer.setInterval(250)
         self._timer.timeout.connect(self._poll_position)
 
         # Track end detection
         events = self._player.event_manager()
         events.event_attach(vlc.EventType.MediaPlayerEndReached, self._on_end_reached)
+        # Fallback for formats whose length is only known once playback starts
+        events.event_attach(
+            vlc.EventType.MediaPlayerLengthChanged,
+            lambda event: self._set_duration(event.u.new_length),
+        )
 
     def play(self, filepath: str) -> None:
         """Load and play an audio file."""
+        self._current_path = filepath
+        self._is_playing = True
+        self.state_changed.emit("playing")
+        self._invoke("_play", Q_ARG(str, filepath))
+
+    @pyqtSlot(str)
+    def _play(self, filepath: str) -> None:
+        """Start VLC playback on the engine thread."""
         media = self._instance.media_new(filepath)
+        self._media = media
+        self._duration_ms = 0
+        # Duration arrives once VLC has parsed the file's headers
+        media.event_manager().event_attach(
+            vlc.EventType.MediaParsedChanged,
+            lambda event: self._on_media_parsed(media),
+        )
         self._player.set_media(media)
+        media.parse_with_options(vlc.MediaParseFlag.local, 3000)
         self._player.play()
-        self._current_path = filepath
-        self._is_playing = True
+        self._last_pos = -1.0
         self._timer.start()
-        self.state_changed.emit("playing")
 
-        # Get duration after a short delay (VLC needs time to parse)
-        QTimer.singleShot(200, self._update_duration)
+    def _on_media_parsed(self, media: vlc.Media) -> None:
+        """Take the duration of a parsed media unless a newer track replaced it (VLC event thread)."""
+        if media is self._media:
+            self._set_duration(media.get_duration())
 
-    def _update_duration(self) -> None:
-        """Update duration after media is loaded."""
-        self._duration_ms = self._player.get_length()
-        if self._duration_ms > 0:
-            self.duration_changed.emit(self._duration_ms)
+    def _set_duration(self, duration_ms: int) -> None:
+        """Record and emit the track duration once it is known (VLC event thread)."""
+        if duration_ms > 0 and duration_ms != self._duration_ms:
+            self._duration_ms = duration_ms
+            self.duration_changed.emit(duration_ms)
 
     def pause(self) -> None:
         """Toggle pause state."""
-        self._player.pause()
         # Track state ourselves since VLC state may not update immediately
         self._is_playing = not self._is_playing
-        if self._is_playing:
+        self.state_changed.emit("playing" if self._is_playing else "paused")
+        self._invoke("_pause", Q_ARG(bool, self._is_playing))
+
+    @pyqtSlot(bool)
+    def _pause(self, resume: bool) -> None:
+        """Toggle VLC pause on the engine thread."""
+        self._player.pause()
+        if resume:
             self._timer.start()
-            self.state_changed.emit("playing")
         else:
             self._timer.stop()
-            self.state_changed.emit("paused")
 
-    def stop(self) -> None:
-        """Stop playback."""
-        self._player.stop()
-        self._timer.stop()
+    def stop(self, blocking: bool = False) -> None:
+        """
+        Stop playback.
+
+        Args:
+            blocking: Wait until VLC has stopped (used on shutdown, before
+                the engine thread exits)
+        """
         self._current_path = None
         self._is_playing = False
         self.state_changed.emit("stopped")
+        if blocking and self.thread() is not QThread.currentThread():
+            QMetaObject.invokeMethod(self, "_stop", Qt.ConnectionType.BlockingQueuedConnection)
+        else:
+            self._invoke("_stop")
+
+    @pyqtSlot()
+    def _stop(self) -> None:
+        """Stop VLC playback on the engine thread."""
+        self._player.stop()
+        self._timer.stop()
 
     def seek(self, position: float) -> None:
         """Seek to position (0.0 to 1.0)."""
-        self._player.set_position(max(0.0, min(1.0, position)))
+        self._invoke("_seek", Q_ARG(float, max(0.0, min(1.0, position))))
+
+    @pyqtSlot(float)
+    def _seek(self, position: float) -> None:
+        """Set VLC position on the engine thread."""
+        self._player.set_position(position)
 
     def seek_ms(self, ms: int) -> None:
         """Seek to position in milliseconds."""
+        self._invoke("_seek_ms", Q_ARG(int, ms))
+
+    @pyqtSlot(int)
+    def _seek_ms(self, ms: int) -> None:
+        """Set VLC time on the engine thread."""
         self._player.set_time(ms)
 
     def get_position(self) -> float:
@@ -102,24 +159,39 @@ class AudioEngine(QObject):
 
     def set_volume(self, level: int) -> None:
         """Set volume (0-100)."""
-        self._player.audio_set_volume(max(0, min(100, level)))
+        self._invoke("_set_volume", Q_ARG(int, max(0, min(100, level))))
+
+    @pyqtSlot(int)
+    def _set_volume(self, level: int) -> None:
+        """Set VLC volume on the engine thread."""
+        self._player.audio_set_volume(level)
 
     def get_volume(self) -> int:
         """Get current volume (0-100)."""
         return self._player.audio_get_volume()
 
+    def _invoke(self, slot: str, *args) -> None:
+        """Queue a slot call onto the engine's thread."""
+        QMetaObject.invokeMethod(self, slot, Qt.ConnectionType.QueuedConnection, *args)
+
     def _poll_position(self) -> None:
         """Poll and emit position updates."""
-        if self._player.is_playing():
-            pos = self.get_position()
-            self.position_changed.emit(pos)
+        if not self._is_playing:
+            return
 
-            # Update duration if we didn't get it earlier
-            if self._duration_ms <= 0:
-                self._update_duration()
+        # Skip emitting when the position hasn't visibly moved
+        pos = self.get_position()
+        if abs(pos - self._last_pos) > 0.001:
+            self._last_pos = pos
+            self.position_changed.emit(pos)
 
     def _on_end_reached(self, event) -> None:
-        """Handle track end."""
+        """Handle track end (VLC event thread) by queueing onto the engine's thread."""
+        self._invoke("_handle_end")
+
+    @pyqtSlot()
+    def _handle_end(self) -> None:
+        """Handle track end on the engine thread."""
         self._timer.stop()
         self._is_playing = False
         # Only emit track_ended - don't emit stopped state here
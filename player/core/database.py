@@ -1,247 +1,477 @@
 """SQLite database for caching track metadata and playlists."""
 
+import os
 import sqlite3
+import threading
 import uuid
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
-from typing import Any
+from itertools import chain
+from typing import Any, Iterable, Iterator
 
 from player.utils.config import CONFIG_DIR
 
 
 DB_PATH = CONFIG_DIR / "library.db"
 
+# Bump when the schema changes; stored in PRAGMA user_version
+_SCHEMA_VERSION = 4
+
+# Database files whose schema has already been checked in this process
+_SCHEMA_READY: set[Path] = set()
+
+# Max bound parameters per statement (stays under SQLITE_MAX_VARIABLE_NUMBER)
+SQL_VARIABLE_CHUNK = 900
+
+_TRACK_COLUMNS = (
+    "filepath, mtime, title, artist, album, year, genre, track_number, "
+    "duration, codec, bitrate, sample_rate, bit_depth"
+)
+_TRACK_ROW = "(" + ", ".join("?" * 13) + ")"
+
+# Multi-row upsert statements keyed by row count, largest first.
+# 64 rows * 13 columns stays under SQL_VARIABLE_CHUNK.
+_UPSERT_CHUNK_SIZES = (64, 16, 1)
+_UPSERT_CONFLICT = """
+    ON CONFLICT(filepath) DO UPDATE SET
+        mtime = excluded.mtime,
+        title = excluded.title,
+        artist = excluded.artist,
+        album = excluded.album,
+        year = excluded.year,
+        genre = excluded.genre,
+        track_number = excluded.track_number,
+        duration = excluded.duration,
+        codec = excluded.codec,
+        bitrate = excluded.bitrate,
+        sample_rate = excluded.sample_rate,
+        bit_depth = excluded.bit_depth
+"""
+_UPSERT_SQL = {
+    size: f"INSERT INTO tracks ({_TRACK_COLUMNS}) VALUES "
+          + ", ".join([_TRACK_ROW] * size)
+          + _UPSERT_CONFLICT
+    for size in _UPSERT_CHUNK_SIZES
+}
+
+
+def _track_params(data: dict[str, Any], mtime: float) -> tuple:
+    """Build the bound parameters for one tracks row."""
+    return (
+        data["filepath"],
+        mtime,
+        data.get("title", "Unknown"),
+        data.get("artist", "Unknown"),
+        data.get("album", "Unknown"),
+        data.get("year", ""),
+        data.get("genre", ""),
+        data.get("track_number", 0),
+        data.get("duration", 0.0),
+        data.get("codec", "Unknown"),
+        data.get("bitrate", 0),
+        data.get("sample_rate", 0),
+        data.get("bit_depth", 0),
+    )
+
+
+def row_to_dict(row: sqlite3.Row | None) -> dict | None:
+    """Convert a result row to a plain dict for callers that need one."""
+    return dict(row) if row is not None else None
+
 
 class LibraryDatabase:
     """SQLite cache for track metadata."""
 
     def __init__(self, db_path: Path = DB_PATH):
         self._db_path = db_path
+        self._conn: sqlite3.Connection | None = None
+        # The connection is shared between the UI thread and scan workers
+        self._lock = threading.Lock()
+        self._favorites_cache: set[str] | None = None
         self._ensure_db_exists()
 
     def _ensure_db_exists(self):
         """Create database and tables if they don't exist."""
+        if self._db_path in _SCHEMA_READY:
+            return
         self._db_path.parent.mkdir(parents=True, exist_ok=True)
 
-        with self._connect() as conn:
-            conn.execute("""
-                CREATE TABLE IF NOT EXISTS tracks (
-                    id INTEGER PRIMARY KEY,
-                    filepath TEXT UNIQUE NOT NULL,
-                    mtime REAL NOT NULL,
-                    title TEXT,
-                    artist TEXT,
-                    album TEXT,
-                    year TEXT,
-                    genre TEXT,
-                    track_number INTEGER,
-                    duration REAL,
-                    codec TEXT,
-                    bitrate INTEGER,
-                    sample_rate INTEGER,
-                    bit_depth INTEGER
-                )
-            """)
-            # Migration: add genre column if it doesn't exist
+        with self._lock, self._connect() as conn:
+            version = conn.execute("PRAGMA user_version").fetchone()[0]
+            if version < _SCHEMA_VERSION:
+                self._create_schema(conn, version)
+                conn.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
+        _SCHEMA_READY.add(self._db_path)
+
+    def _create_schema(self, conn: sqlite3.Connection, version: int) -> None:
+        """Create tables and indexes, migrating databases from older versions."""
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS tracks (
+                id INTEGER PRIMARY KEY,
+                filepath TEXT UNIQUE NOT NULL,
+                mtime REAL NOT NULL,
+                title TEXT,
+                artist TEXT,
+                album TEXT,
+                year TEXT,
+                genre TEXT,
+                track_number INTEGER,
+                duration REAL,
+                codec TEXT,
+                bitrate INTEGER,
+                sample_rate INTEGER,
+                bit_depth INTEGER
+            )
+        """)
+        if version == 0:
+            # Unversioned databases may predate the genre column
             cursor = conn.execute("PRAGMA table_info(tracks)")
             columns = [row[1] for row in cursor.fetchall()]
             if "genre" not in columns:
                 conn.execute("ALTER TABLE tracks ADD COLUMN genre TEXT")
-            conn.execute("""
-                CREATE INDEX IF NOT EXISTS idx_filepath ON tracks(filepath)
-            """)
-            conn.execute("""
-                CREATE INDEX IF NOT EXISTS idx_artist_album ON tracks(artist, album)
-            """)
-            # Playlists tables
-            conn.execute("""
-                CREATE TABLE IF NOT EXISTS playlists (
-                    id TEXT PRIMARY KEY,
-                    name TEXT NOT NULL,
-                    created_at REAL NOT NULL,
-                    modified_at REAL NOT NULL
-                )
-            """)
-            conn.execute("""
-                CREATE TABLE IF NOT EXISTS playlist_tracks (
-                    id INTEGER PRIMARY KEY,
-                    playlist_id TEXT NOT NULL,
-                    track_path TEXT NOT NULL,
-                    position INTEGER NOT NULL,
-                    FOREIGN KEY (playlist_id) REFERENCES playlists(id) ON DELETE CASCADE
-                )
-            """)
-            conn.execute("""
-                CREATE INDEX IF NOT EXISTS idx_playlist_tracks_playlist
-                ON playlist_tracks(playlist_id, position)
-            """)
-            # Favorites table
-            conn.execute("""
-                CREATE TABLE IF NOT EXISTS favorites (
-                    filepath TEXT PRIMARY KEY
+        # filepath is UNIQUE, which already provides an index
+        conn.execute("DROP INDEX IF EXISTS idx_filepath")
+        conn.execute("""
+            CREATE INDEX IF NOT EXISTS idx_artist_album ON tracks(artist, album)
+        """)
+        conn.execute("""
+            CREATE INDEX IF NOT EXISTS idx_tracks_album_tracknum ON tracks(album, track_number)
+        """)
+        conn.execute("""
+            CREATE INDEX IF NOT EXISTS idx_tracks_artist_year ON tracks(artist, year)
+        """)
+        # Playlists tables
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS playlists (
+                id TEXT PRIMARY KEY,
+                name TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                modified_at REAL NOT NULL,
+                track_count INTEGER NOT NULL DEFAULT 0
+            )
+        """)
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS playlist_tracks (
+                id INTEGER PRIMARY KEY,
+                playlist_id TEXT NOT NULL,
+                track_path TEXT NOT NULL,
+                position INTEGER NOT NULL,
+                FOREIGN KEY (playlist_id) REFERENCES playlists(id) ON DELETE CASCADE
+            )
+        """)
+        conn.execute("""
+            CREATE INDEX IF NOT EXISTS idx_playlist_tracks_playlist
+            ON playlist_tracks(playlist_id, position)
+        """)
+        if version < 3:
+            # Denormalized playlist track counts
+            cursor = conn.execute("PRAGMA table_info(playlists)")
+            columns = [row[1] for row in cursor.fetchall()]
+            if "track_count" not in columns:
+                conn.execute(
+                    "ALTER TABLE playlists ADD COLUMN track_count INTEGER NOT NULL DEFAULT 0"
                 )
-            """)
-            conn.commit()
+                conn.execute("""
+                    UPDATE playlists SET track_count = (
+                        SELECT COUNT(*) FROM playlist_tracks
+                        WHERE playlist_id = playlists.id
+                    )
+                """)
+        # Favorites table
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS favorites (
+                filepath TEXT PRIMARY KEY
+            )
+        """)
+        # Full-text index over tracks, kept in sync by triggers
+        conn.execute("""
+            CREATE VIRTUAL TABLE IF NOT EXISTS tracks_fts USING fts5(
+                title, artist, album,
+                content='tracks', content_rowid='id',
+                tokenize='unicode61 remove_diacritics 2'
+            )
+        """)
+        conn.execute("""
+            CREATE TRIGGER IF NOT EXISTS tracks_fts_insert AFTER INSERT ON tracks BEGIN
+                INSERT INTO tracks_fts (rowid, title, artist, album)
+                VALUES (new.id, new.title, new.artist, new.album);
+            END
+        """)
+        conn.execute("""
+            CREATE TRIGGER IF NOT EXISTS tracks_fts_delete AFTER DELETE ON tracks BEGIN
+                INSERT INTO tracks_fts (tracks_fts, rowid, title, artist, album)
+                VALUES ('delete', old.id, old.title, old.artist, old.album);
+            END
+        """)
+        conn.execute("""
+            CREATE TRIGGER IF NOT EXISTS tracks_fts_update AFTER UPDATE ON tracks BEGIN
+                INSERT INTO tracks_fts (tracks_fts, rowid, title, artist, album)
+                VALUES ('delete', old.id, old.title, old.artist, old.album);
+                INSERT INTO tracks_fts (rowid, title, artist, album)
+                VALUES (new.id, new.title, new.artist, new.album);
+            END
+        """)
+        if version < 4:
+            # Index tracks cached before the full-text table existed
+            conn.execute("INSERT INTO tracks_fts (tracks_fts) VALUES ('rebuild')")
 
     def _connect(self) -> sqlite3.Connection:
-        """Create a database connection."""
-        conn = sqlite3.connect(str(self._db_path))
-        conn.row_factory = sqlite3.Row
-        return conn
+        """Get the shared database connection, creating it on first use."""
+        if self._conn is None:
+            conn = sqlite3.connect(str(self._db_path), check_same_thread=False)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA temp_store=MEMORY")
+            conn.execute("PRAGMA mmap_size=268435456")
+            conn.execute("PRAGMA cache_size=-40000")
+            conn.execute("PRAGMA journal_size_limit=67108864")
+            self._conn = conn
+        return self._conn
+
+    @contextmanager
+    def _writing(self) -> Iterator[sqlite3.Connection]:
+        """Run a multi-statement write as a single IMMEDIATE transaction."""
+        with self._lock:
+            conn = self._connect()
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+            except BaseException:
+                conn.rollback()
+                raise
+            conn.commit()
+
+    def close(self) -> None:
+        """Close the shared database connection."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
 
-    def get_all_tracks(self) -> list[dict]:
+    def get_all_tracks(self) -> list[sqlite3.Row]:
         """Get all tracks from the database."""
-        with self._connect() as conn:
+        return list(self.iter_tracks())
+
+    def iter_tracks(self, chunk_size: int = 1000) -> Iterator[sqlite3.Row]:
+        """
+        Iterate over all tracks without materializing the whole table.
+
+        Rows are fetched chunk_size at a time from a separate read connection
+        holding one read transaction, so the iteration sees a stable snapshot.
+        Writes made through the shared connection meanwhile are neither blocked
+        (WAL) nor visible to it.
+        """
+        conn = sqlite3.connect(str(self._db_path), isolation_level=None, check_same_thread=False)
+        try:
+            conn.row_factory = sqlite3.Row
+            conn.execute("BEGIN")
             cursor = conn.execute("""
                 SELECT filepath, mtime, title, artist, album, year, genre,
                        track_number, duration, codec, bitrate,
                        sample_rate, bit_depth
                 FROM tracks
             """)
-            return [dict(row) for row in cursor.fetchall()]
-
-    def get_track(self, filepath: str) -> dict | None:
+            cursor.arraysize = chunk_size
+            while True:
+                rows = cursor.fetchmany()
+                if not rows:
+                    return
+                yield from rows
+        finally:
+            conn.close()
+
+    def get_track(self, filepath: str) -> sqlite3.Row | None:
         """Get a single track by filepath."""
-        with self._connect() as conn:
+        with self._lock, self._connect() as conn:
             cursor = conn.execute(
                 "SELECT * FROM tracks WHERE filepath = ?",
                 (filepath,)
             )
-            row = cursor.fetchone()
-            return dict(row) if row else None
+            return cursor.fetchone()
+
+    def get_tracks_bulk(self, filepaths: list[str]) -> dict[str, sqlite3.Row]:
+        """Get multiple tracks by filepath. Returns filepath -> track row."""
+        result: dict[str, sqlite3.Row] = {}
+        with self._lock, self._connect() as conn:
+            for start in range(0, len(filepaths), SQL_VARIABLE_CHUNK):
+                chunk = filepaths[start:start + SQL_VARIABLE_CHUNK]
+                placeholders = ",".join("?" * len(chunk))
+                cursor = conn.execute(f"""
+                    SELECT filepath, mtime, title, artist, album, year, genre,
+                           track_number, duration, codec, bitrate,
+                           sample_rate, bit_depth
+                    FROM tracks
+                    WHERE filepath IN ({placeholders})
+                """, chunk)
+                for row in cursor.fetchall():
+                    result[row["filepath"]] = row
+        return result
 
     def get_cached_mtimes(self) -> dict[str, float]:
         """Get filepath -> mtime mapping for all cached tracks."""
-        with self._connect() as conn:
+        with self._lock, self._connect() as conn:
             cursor = conn.execute("SELECT filepath, mtime FROM tracks")
             return {row["filepath"]: row["mtime"] for row in cursor.fetchall()}
 
     def upsert_track(self, track_data: dict[str, Any], mtime: float) -> None:
         """Insert or update a single track."""
-        with self._connect() as conn:
-            conn.execute("""
-                INSERT OR REPLACE INTO tracks
-                (filepath, mtime, title, artist, album, year, genre, track_number,
-                 duration, codec, bitrate, sample_rate, bit_depth)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                track_data["filepath"],
-                mtime,
-                track_data.get("title", "Unknown"),
-                track_data.get("artist", "Unknown"),
-                track_data.get("album", "Unknown"),
-                track_data.get("year", ""),
-                track_data.get("genre", ""),
-                track_data.get("track_number", 0),
-                track_data.get("duration", 0.0),
-                track_data.get("codec", "Unknown"),
-                track_data.get("bitrate", 0),
-                track_data.get("sample_rate", 0),
-                track_data.get("bit_depth", 0),
-            ))
-            conn.commit()
+        with self._lock, self._connect() as conn:
+            conn.execute(_UPSERT_SQL[1], _track_params(track_data, mtime))
 
-    def upsert_tracks(self, tracks: list[tuple[dict[str, Any], float]]) -> None:
+    def upsert_tracks(self, tracks: Iterable[tuple[dict[str, Any], float]]) -> None:
         """Batch insert or update tracks. Each tuple is (track_data, mtime)."""
-        if not tracks:
-            return
-
-        with self._connect() as conn:
-            conn.executemany("""
-                INSERT OR REPLACE INTO tracks
-                (filepath, mtime, title, artist, album, year, genre, track_number,
-                 duration, codec, bitrate, sample_rate, bit_depth)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, [
-                (
-                    data["filepath"],
-                    mtime,
-                    data.get("title", "Unknown"),
-                    data.get("artist", "Unknown"),
-                    data.get("album", "Unknown"),
-                    data.get("year", ""),
-                    data.get("genre", ""),
-                    data.get("track_number", 0),
-                    data.get("duration", 0.0),
-                    data.get("codec", "Unknown"),
-                    data.get("bitrate", 0),
-                    data.get("sample_rate", 0),
-                    data.get("bit_depth", 0),
-                )
-                for data, mtime in tracks
-            ])
-            conn.commit()
+        largest = _UPSERT_CHUNK_SIZES[0]
+        with self._writing() as conn:
+            # Stream rows into the largest multi-row template, one batch at a time
+            batch: list[tuple] = []
+            for data, mtime in tracks:
+                batch.append(_track_params(data, mtime))
+                if len(batch) == largest:
+                    conn.execute(_UPSERT_SQL[largest], list(chain.from_iterable(batch)))
+                    batch.clear()
+
+            # Flush the remainder with the smaller templates
+            start = 0
+            for size in _UPSERT_CHUNK_SIZES[1:]:
+                while len(batch) - start >= size:
+                    params = list(chain.from_iterable(batch[start:start + size]))
+                    conn.execute(_UPSERT_SQL[size], params)
+                    start += size
 
     def remove_tracks(self, filepaths: list[str]) -> None:
         """Remove tracks by filepath."""
         if not filepaths:
             return
 
-        with self._connect() as conn:
+        with self._lock, self._connect() as conn:
             placeholders = ",".join("?" * len(filepaths))
             conn.execute(
                 f"DELETE FROM tracks WHERE filepath IN ({placeholders})",
                 filepaths
             )
-            conn.commit()
 
     def remove_tracks_not_in(self, valid_filepaths: set[str]) -> int:
         """Remove tracks whose filepath is not in the given set. Returns count removed."""
-        with self._connect() as conn:
-            # Get all filepaths in DB
-            cursor = conn.execute("SELECT filepath FROM tracks")
-            db_paths = {row["filepath"] for row in cursor.fetchall()}
+        with self._writing() as conn:
+            # Diff inside SQLite via a temp table instead of pulling every path into Python
+            conn.execute("CREATE TEMP TABLE IF NOT EXISTS valid_paths (filepath TEXT PRIMARY KEY)")
+            conn.execute("DELETE FROM valid_paths")
+            conn.executemany(
+                "INSERT OR IGNORE INTO valid_paths (filepath) VALUES (?)",
+                ((path,) for path in valid_filepaths)
+            )
+            cursor = conn.execute(
+                "DELETE FROM tracks WHERE filepath NOT IN (SELECT filepath FROM valid_paths)"
+            )
+            removed = cursor.rowcount
+            conn.execute("DELETE FROM valid_paths")
 
-            # Find paths to remove
-            to_remove = db_paths - valid_filepaths
+            return removed
 
-            if to_remove:
-                placeholders = ",".join("?" * len(to_remove))
-                conn.execute(
-                    f"DELETE FROM tracks WHERE filepath IN ({placeholders})",
-                    list(to_remove)
-                )
-                conn.commit()
+    def diff_paths(
+        self, scanned: Iterable[tuple[str, float, int]], roots: Iterable[str]
+    ) -> tuple[list[tuple[str, float, int]], list[tuple[str, float, int]], int]:
+        """
+        Diff a scan against the cache and drop tracks no longer on disk.
 
-            return len(to_remove)
+        Only tracks under the scanned roots are dropped, so tracks under a
+        root that is missing or unmounted are kept.
+
+        Args:
+            scanned: (filepath, mtime, size) for every file found on disk
+            roots: Directories that were walked to produce scanned
+
+        Returns:
+            Tuple of (new, modified, removed_count); new and modified are
+            (filepath, mtime, size) tuples in scan order
+        """
+        with self._writing() as conn:
+            conn.execute(
+                "CREATE TEMP TABLE IF NOT EXISTS scan (filepath TEXT PRIMARY KEY, mtime REAL, size INTEGER)"
+            )
+            conn.execute("DELETE FROM scan")
+            conn.executemany("INSERT OR IGNORE INTO scan (filepath, mtime, size) VALUES (?, ?, ?)", scanned)
+            new = conn.execute(
+                """SELECT s.filepath, s.mtime, s.size FROM scan s
+                   LEFT JOIN tracks t ON t.filepath = s.filepath
+                   WHERE t.filepath IS NULL ORDER BY s.rowid"""
+            ).fetchall()
+            modified = conn.execute(
+                """SELECT s.filepath, s.mtime, s.size FROM scan s
+                   JOIN tracks t ON t.filepath = s.filepath
+                   WHERE s.mtime > t.mtime ORDER BY s.rowid"""
+            ).fetchall()
+            removed = 0
+            for root in roots:
+                prefix = root.rstrip(os.sep) + os.sep
+                removed += conn.execute(
+                    """DELETE FROM tracks WHERE substr(filepath, 1, ?) = ?
+                       AND filepath NOT IN (SELECT filepath FROM scan)""",
+                    (len(prefix), prefix),
+                ).rowcount
+            conn.execute("DELETE FROM scan")
+
+            return [tuple(r) for r in new], [tuple(r) for r in modified], removed
 
     def clear(self) -> None:
         """Remove all tracks from the database."""
-        with self._connect() as conn:
+        with self._lock, self._connect() as conn:
             conn.execute("DELETE FROM tracks")
-            conn.commit()
 
     def count(self) -> int:
         """Get total number of cached tracks."""
-        with self._connect() as conn:
+        with self._lock, self._connect() as conn:
             cursor = conn.execute("SELECT COUNT(*) FROM tracks")
             return cursor.fetchone()[0]
 
+    def search(self, query: str) -> list[str]:
+        """
+        Full-text search over title, artist and album.
+
+        Each whitespace-separated term is matched as a prefix; all terms
+        must match. Returns filepaths ordered by relevance.
+        """
+        terms = query.split()
+        if not terms:
+            return []
+        # Quote terms so user input is never parsed as FTS5 syntax
+        match = " ".join('"' + term.replace('"', '""') + '"*' for term in terms)
+        with self._lock, self._connect() as conn:
+            cursor = conn.execute("""
+                SELECT tracks.filepath
+                FROM tracks_fts
+                JOIN tracks ON tracks.id = tracks_fts.rowid
+                WHERE tracks_fts MATCH ?
+                ORDER BY tracks_fts.rank
+            """, (match,))
+            return [row[0] for row in cursor.fetchall()]
+
     # --- Playlist methods ---
 
-    def get_all_playlists(self) -> list[dict]:
+    def get_all_playlists(self) -> list[sqlite3.Row]:
         """Get all playlists (without tracks)."""
-        with self._connect() as conn:
+        with self._lock, self._connect() as conn:
             cursor = conn.execute("""
-                SELECT id, name, created_at, modified_at
+                SELECT id, name, created_at, modified_at, track_count
                 FROM playlists
                 ORDER BY name
             """)
-            return [dict(row) for row in cursor.fetchall()]
+            return cursor.fetchall()
 
-    def get_playlist(self, playlist_id: str) -> dict | None:
+    def get_playlist(self, playlist_id: str) -> sqlite3.Row | None:
         """Get a playlist by ID."""
-        with self._connect() as conn:
+        with self._lock, self._connect() as conn:
             cursor = conn.execute(
-                "SELECT id, name, created_at, modified_at FROM playlists WHERE id = ?",
+                "SELECT id, name, created_at, modified_at, track_count FROM playlists WHERE id = ?",
                 (playlist_id,)
             )
-            row = cursor.fetchone()
-            return dict(row) if row else None
+            return cursor.fetchone()
 
     def get_playlist_tracks(self, playlist_id: str) -> list[str]:
         """Get track paths for a playlist in order."""
-        with self._connect() as conn:
+        with self._lock, self._connect() as conn:
             cursor = conn.execute("""
                 SELECT track_path FROM playlist_tracks
                 WHERE playlist_id = ?
@@ -251,48 +481,53 @@ class LibraryDatabase:
 
     def get_playlist_track_count(self, playlist_id: str) -> int:
         """Get number of tracks in a playlist."""
-        with self._connect() as conn:
+        with self._lock, self._connect() as conn:
             cursor = conn.execute(
-                "SELECT COUNT(*) FROM playlist_tracks WHERE playlist_id = ?",
+                "SELECT track_count FROM playlists WHERE id = ?",
                 (playlist_id,)
             )
-            return cursor.fetchone()[0]
+            row = cursor.fetchone()
+            return row[0] if row else 0
 
-    def create_playlist(self, name: str) -> str:
-        """Create a new playlist. Returns the playlist ID."""
+    def create_playlist(self, name: str, track_paths: list[str] | None = None) -> str:
+        """Create a new playlist, optionally with initial tracks. Returns the playlist ID."""
         playlist_id = str(uuid.uuid4())
         now = datetime.now().timestamp()
-        with self._connect() as conn:
+        track_paths = track_paths or []
+        # Playlist row and its tracks go in one transaction (one commit)
+        with self._writing() as conn:
             conn.execute(
-                "INSERT INTO playlists (id, name, created_at, modified_at) VALUES (?, ?, ?, ?)",
-                (playlist_id, name, now, now)
+                "INSERT INTO playlists (id, name, created_at, modified_at, track_count) VALUES (?, ?, ?, ?, ?)",
+                (playlist_id, name, now, now, len(track_paths))
             )
-            conn.commit()
+            if track_paths:
+                conn.executemany(
+                    "INSERT INTO playlist_tracks (playlist_id, track_path, position) VALUES (?, ?, ?)",
+                    [(playlist_id, path, i) for i, path in enumerate(track_paths)]
+                )
         return playlist_id
 
     def rename_playlist(self, playlist_id: str, name: str) -> None:
         """Rename a playlist."""
         now = datetime.now().timestamp()
-        with self._connect() as conn:
+        with self._lock, self._connect() as conn:
             conn.execute(
                 "UPDATE playlists SET name = ?, modified_at = ? WHERE id = ?",
                 (name, now, playlist_id)
             )
-            conn.commit()
 
     def delete_playlist(self, playlist_id: str) -> None:
         """Delete a playlist and its tracks."""
-        with self._connect() as conn:
+        with self._writing() as conn:
             conn.execute("DELETE FROM playlist_tracks WHERE playlist_id = ?", (playlist_id,))
             conn.execute("DELETE FROM playlists WHERE id = ?", (playlist_id,))
-            conn.commit()
 
     def add_tracks_to_playlist(self, playlist_id: str, track_paths: list[str]) -> None:
         """Add tracks to the end of a playlist."""
         if not track_paths:
             return
         now = datetime.now().timestamp()
-        with self._connect() as conn:
+        with self._writing() as conn:
             # Get current max position
             cursor = conn.execute(
                 "SELECT COALESCE(MAX(position), -1) FROM playlist_tracks WHERE playlist_id = ?",
@@ -306,42 +541,43 @@ class LibraryDatabase:
                 [(playlist_id, path, max_pos + 1 + i) for i, path in enumerate(track_paths)]
             )
             conn.execute(
-                "UPDATE playlists SET modified_at = ? WHERE id = ?",
-                (now, playlist_id)
+                "UPDATE playlists SET track_count = track_count + ?, modified_at = ? WHERE id = ?",
+                (len(track_paths), now, playlist_id)
             )
-            conn.commit()
 
     def remove_tracks_from_playlist(self, playlist_id: str, track_paths: list[str]) -> None:
         """Remove tracks from a playlist."""
         if not track_paths:
             return
         now = datetime.now().timestamp()
-        with self._connect() as conn:
+        with self._writing() as conn:
             placeholders = ",".join("?" * len(track_paths))
-            conn.execute(
+            cursor = conn.execute(
                 f"DELETE FROM playlist_tracks WHERE playlist_id = ? AND track_path IN ({placeholders})",
                 [playlist_id] + track_paths
             )
-            # Reorder remaining tracks
-            cursor = conn.execute(
-                "SELECT id FROM playlist_tracks WHERE playlist_id = ? ORDER BY position",
-                (playlist_id,)
-            )
-            for i, row in enumerate(cursor.fetchall()):
-                conn.execute(
-                    "UPDATE playlist_tracks SET position = ? WHERE id = ?",
-                    (i, row["id"])
+            removed = cursor.rowcount
+            # Reorder remaining tracks in a single statement
+            conn.execute("""
+                UPDATE playlist_tracks SET position = (
+                    SELECT ranked.rn - 1 FROM (
+                        SELECT id, ROW_NUMBER() OVER (ORDER BY position) AS rn
+                        FROM playlist_tracks
+                        WHERE playlist_id = ?
+                    ) AS ranked
+                    WHERE ranked.id = playlist_tracks.id
                 )
+                WHERE playlist_id = ?
+            """, (playlist_id, playlist_id))
             conn.execute(
-                "UPDATE playlists SET modified_at = ? WHERE id = ?",
-                (now, playlist_id)
+                "UPDATE playlists SET track_count = track_count - ?, modified_at = ? WHERE id = ?",
+                (removed, now, playlist_id)
             )
-            conn.commit()
 
     def set_playlist_tracks(self, playlist_id: str, track_paths: list[str]) -> None:
         """Replace all tracks in a playlist."""
         now = datetime.now().timestamp()
-        with self._connect() as conn:
+        with self._writing() as conn:
             conn.execute("DELETE FROM playlist_tracks WHERE playlist_id = ?", (playlist_id,))
             if track_paths:
                 conn.executemany(
@@ -349,45 +585,63 @@ class LibraryDatabase:
                     [(playlist_id, path, i) for i, path in enumerate(track_paths)]
                 )
             conn.execute(
-                "UPDATE playlists SET modified_at = ? WHERE id = ?",
-                (now, playlist_id)
+                "UPDATE playlists SET track_count = ?, modified_at = ? WHERE id = ?",
+                (len(track_paths), now, playlist_id)
             )
-            conn.commit()
 
     # --- Favorites methods ---
 
+    def _favorites(self) -> set[str]:
+        """Get the in-memory favorites set, loading it on first use. Caller holds the lock."""
+        if self._favorites_cache is None:
+            cursor = self._connect().execute("SELECT filepath FROM favorites")
+            self._favorites_cache = {row["filepath"] for row in cursor.fetchall()}
+        return self._favorites_cache
+
+    def invalidate_favorites(self) -> None:
+        """Drop the in-memory favorites set so it is reloaded on next access."""
+        with self._lock:
+            self._favorites_cache = None
+
     def is_favorite(self, filepath: str) -> bool:
         """Check if a track is a favorite."""
-        with self._connect() as conn:
-            cursor = conn.execute(
-                "SELECT 1 FROM favorites WHERE filepath = ?",
+        with self._lock:
+            if self._favorites_cache is not None:
+                return filepath in self._favorites_cache
+            # Cold cache: a single indexed probe beats loading the whole table
+            cursor = self._connect().execute(
+                "SELECT EXISTS(SELECT 1 FROM favorites WHERE filepath = ? LIMIT 1)",
                 (filepath,)
             )
-            return cursor.fetchone() is not None
+            return bool(cursor.fetchone()[0])
 
     def set_favorite(self, filepath: str, favorite: bool) -> None:
         """Set or unset a track as favorite."""
-        with self._connect() as conn:
+        with self._lock:
+            favorites = self._favorites()
+            with self._connect() as conn:
+                if favorite:
+                    conn.execute(
+                        "INSERT OR IGNORE INTO favorites (filepath) VALUES (?)",
+                        (filepath,)
+                    )
+                else:
+                    conn.execute(
+                        "DELETE FROM favorites WHERE filepath = ?",
+                        (filepath,)
+                    )
+            # Write through to the cache once the change is committed
             if favorite:
-                conn.execute(
-                    "INSERT OR IGNORE INTO favorites (filepath) VALUES (?)",
-                    (filepath,)
-                )
+                favorites.add(filepath)
             else:
-                conn.execute(
-                    "DELETE FROM favorites WHERE filepath = ?",
-                    (filepath,)
-                )
-            conn.commit()
+                favorites.discard(filepath)
 
     def get_all_favorites(self) -> set[str]:
         """Get all favorite track filepaths."""
-        with self._connect() as conn:
-            cursor = conn.execute("SELECT filepath FROM favorites")
-            return {row["filepath"] for row in cursor.fetchall()}
+        with self._lock:
+            return set(self._favorites())
 
     def get_favorites_count(self) -> int:
         """Get number of favorite tracks."""
-        with self._connect() as conn:
-            cursor = conn.execute("SELECT COUNT(*) FROM favorites")
-            return cursor.fetchone()[0]
+        with self._lock:
+            return len(self._favorites())
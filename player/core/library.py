@@ -1,5 +1,10 @@
 """Library scanner for discovering audio files."""
 
+import multiprocessing
+import os
+import queue
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
 from typing import Callable
 
@@ -9,73 +14,88 @@ from player.core.metadata import Track
 
 SUPPORTED_EXTENSIONS = {".mp3", ".flac", ".ogg", ".wav", ".m4a", ".opus", ".aac", ".wma"}
 
+# Extensions without the leading dot, for matching raw directory entry names
+AUDIO_EXTENSIONS = frozenset(ext.lstrip(".") for ext in SUPPORTED_EXTENSIONS)
+
+# Scanned tracks are written to the database in batches of this size
+SCAN_FLUSH_SIZE = 500
+
+# Files processed between cancellation checks (power of two)
+CANCEL_CHECK_INTERVAL = 128
+
+# Files handed to each extraction worker at a time
+EXTRACT_CHUNK_SIZE = 64
+
+# Header bytes to read ahead per file (enough for tag parsing in most formats),
+# and how many files beyond those already handed to workers to prefetch
+PREFETCH_BYTES = 65536
+PREFETCH_AHEAD = 64
+
+# Flags for opening directories so they can be listed and stat'ed by fd
+DIR_OPEN_FLAGS = os.O_RDONLY | os.O_DIRECTORY | getattr(os, "O_CLOEXEC", 0)
+
+# Directory listing is I/O-bound, so use more walker threads than cores
+WALK_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
 
 class LibraryScanner:
     """Scans directories for audio files and creates Track objects."""
 
     def __init__(self, database: LibraryDatabase | None = None):
-        self._cancel_requested = False
+        self._cancel = threading.Event()
         self._db = database or LibraryDatabase()
 
     def load_from_cache(self) -> list[Track]:
         """Fast load all tracks from database (no file I/O)."""
-        cached = self._db.get_all_tracks()
-        return [Track.from_cache(data) for data in cached]
+        # Share one str object per distinct artist/album/genre across tracks
+        artists: dict[str, str] = {}
+        albums: dict[str, str] = {}
+        genres: dict[str, str] = {}
+
+        tracks = []
+        for data in self._db.iter_tracks():
+            track = Track.from_cache(data)
+            track.artist = artists.setdefault(track.artist, track.artist)
+            track.album = albums.setdefault(track.album, track.album)
+            track.genre = genres.setdefault(track.genre, track.genre)
+            tracks.append(track)
+        return tracks
 
     def scan_for_changes(
         self,
-        path: str | Path,
+        paths: str | Path | list[Path],
         progress_callback: Callable[[int, int, str], None] | None = None,
     ) -> tuple[list[Track], int, int]:
         """
         Incremental scan - only read metadata for new/modified files.
 
         Args:
-            path: Directory path to scan
+            paths: Directory path, or list of library root directories, to scan
             progress_callback: Optional callback(current, total, status) for progress
 
         Returns:
             Tuple of (all_tracks, added_count, removed_count)
         """
-        self._cancel_requested = False
-        directory = Path(path)
+        self._cancel.clear()
+        if isinstance(paths, (str, Path)):
+            paths = [Path(paths)]
+        directories = [d for d in paths if d.is_dir()]
 
-        if not directory.is_dir():
+        if not directories:
             return [], 0, 0
 
-        # Get cached mtimes
-        cached_mtimes = self._db.get_cached_mtimes()
-
         # Find all audio files on disk
         if progress_callback:
             progress_callback(0, 0, "Discovering files...")
-        audio_files = self._find_audio_files(directory)
-        current_paths = {str(f) for f in audio_files}
-
-        # Determine what changed
-        new_files: list[Path] = []
-        modified_files: list[Path] = []
-        unchanged_paths: list[str] = []
-
-        for filepath in audio_files:
-            if self._cancel_requested:
-                break
-            path_str = str(filepath)
-            if path_str not in cached_mtimes:
-                new_files.append(filepath)
-            else:
-                try:
-                    current_mtime = filepath.stat().st_mtime
-                    if current_mtime > cached_mtimes[path_str]:
-                        modified_files.append(filepath)
-                    else:
-                        unchanged_paths.append(path_str)
-                except OSError:
-                    # File disappeared
-                    pass
+        audio_files: list[tuple[str, float, int]] = []
+        for directory in directories:
+            audio_files.extend(self._find_audio_files(directory))
 
-        # Remove deleted files from cache
-        removed_count = self._db.remove_tracks_not_in(current_paths)
+        # Determine what changed and remove deleted files from cache, all in SQLite.
+        # Removals are limited to the walked roots; a missing root keeps its tracks.
+        new_files, modified_files, removed_count = self._db.diff_paths(
+            audio_files, [str(d) for d in directories]
+        )
 
         # Process new and modified files
         files_to_scan = new_files + modified_files
@@ -85,22 +105,51 @@ class LibraryScanner:
         if progress_callback:
             progress_callback(0, total_to_scan, f"Scanning {total_to_scan} files...")
 
-        for i, filepath in enumerate(files_to_scan):
-            if self._cancel_requested:
-                break
-
-            try:
-                track = Track.from_file(filepath)
-                mtime = filepath.stat().st_mtime
-                tracks_to_upsert.append((track.to_cache_dict(), mtime))
-            except Exception:
-                # Skip files that can't be read
-                pass
-
-            if progress_callback:
-                progress_callback(i + 1, total_to_scan, f"Scanning... ({i + 1}/{total_to_scan})")
-
-        # Batch update database
+        if files_to_scan:
+            workers = os.cpu_count() or 1
+
+            # Warm the page cache with file headers a bounded distance ahead of the workers
+            prefetch_window = threading.Semaphore(workers * EXTRACT_CHUNK_SIZE + PREFETCH_AHEAD)
+            prefetch_stop = threading.Event()
+            if hasattr(os, "posix_fadvise"):
+                threading.Thread(
+                    target=_prefetch_headers,
+                    args=([f for f, _, _ in files_to_scan], prefetch_window, prefetch_stop),
+                    daemon=True,
+                ).start()
+
+            # Tag parsing is CPU-bound Python, so fan it out across processes.
+            # forkserver avoids forking the (threaded) GUI process.
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context("forkserver"),
+            ) as pool:
+                results = pool.map(
+                    _extract_track_tuple,
+                    [f for f, _, _ in files_to_scan],
+                    [m for _, m, _ in files_to_scan],
+                    [size for _, _, size in files_to_scan],
+                    chunksize=EXTRACT_CHUNK_SIZE,
+                )
+                for i, result in enumerate(results):
+                    prefetch_window.release()
+                    if i & (CANCEL_CHECK_INTERVAL - 1) == 0 and self._cancel.is_set():
+                        pool.shutdown(wait=False, cancel_futures=True)
+                        break
+                    if result is not None:
+                        tracks_to_upsert.append(result)
+                        if len(tracks_to_upsert) >= SCAN_FLUSH_SIZE:
+                            # Commit as we go so memory stays bounded and a cancel keeps progress
+                            self._db.upsert_tracks(tracks_to_upsert)
+                            tracks_to_upsert.clear()
+
+                    if progress_callback:
+                        progress_callback(i + 1, total_to_scan, f"Scanning... ({i + 1}/{total_to_scan})")
+
+            prefetch_stop.set()
+            prefetch_window.release()
+
+        # Write whatever is left of the last batch
         if tracks_to_upsert:
             self._db.upsert_tracks(tracks_to_upsert)
 
@@ -125,14 +174,14 @@ class LibraryScanner:
         Returns:
             List of Track objects
         """
-        self._cancel_requested = False
+        self._cancel.clear()
         directory = Path(path)
 
         if not directory.is_dir():
             return []
 
         # First pass: collect all audio files
-        audio_files = self._find_audio_files(directory)
+        audio_files = [f for f, _, _ in self._find_audio_files(directory)]
 
         if not audio_files:
             return []
@@ -142,7 +191,7 @@ class LibraryScanner:
         total = len(audio_files)
 
         for i, filepath in enumerate(audio_files):
-            if self._cancel_requested:
+            if i & (CANCEL_CHECK_INTERVAL - 1) == 0 and self._cancel.is_set():
                 break
 
             track = Track.from_file(filepath)
@@ -153,24 +202,94 @@ class LibraryScanner:
 
         return tracks
 
-    def _find_audio_files(self, directory: Path) -> list[Path]:
-        """Find all audio files in directory recursively."""
-        audio_files = []
-
-        try:
-            for item in directory.rglob("*"):
-                if item.is_file() and item.suffix.lower() in SUPPORTED_EXTENSIONS:
-                    audio_files.append(item)
-        except PermissionError:
-            pass
+    def _find_audio_files(self, directory: Path) -> list[tuple[str, float, int]]:
+        """Find all audio files in directory recursively, with their mtimes and sizes."""
+        # Directories waiting to be listed; workers push subdirectories back on
+        pending: queue.Queue[str | None] = queue.Queue()
+        found: list[list[tuple[str, float, int]]] = []
+        # (st_dev, st_ino) of listed directories, so bind-mount loops are walked once
+        visited: set[tuple[int, int]] = set()
+        visited_lock = threading.Lock()
+
+        def walk() -> None:
+            matches: list[tuple[str, float, int]] = []
+            found.append(matches)
+            while (dirpath := pending.get()) is not None:
+                fd = -1
+                try:
+                    # List and stat relative to the directory fd rather than re-resolving paths
+                    fd = os.open(dirpath, DIR_OPEN_FLAGS)
+                    st = os.fstat(fd)
+                    with visited_lock:
+                        if (st.st_dev, st.st_ino) in visited:
+                            continue
+                        visited.add((st.st_dev, st.st_ino))
+                    with os.scandir(fd) as entries:
+                        for entry in entries:
+                            if entry.is_dir(follow_symlinks=False):
+                                pending.put(os.path.join(dirpath, entry.name))
+                                continue
+                            name = entry.name
+                            dot = name.rfind(".")
+                            if dot <= 0:
+                                continue
+                            ext = name[dot + 1:]
+                            # Exact-case hit first; only lowercase the odd ".MP3"/".Flac"
+                            if (ext in AUDIO_EXTENSIONS or ext.lower() in AUDIO_EXTENSIONS) and entry.is_file():
+                                st = entry.stat()
+                                matches.append((os.path.join(dirpath, name), st.st_mtime, st.st_size))
+                except OSError:
+                    # Unreadable directory
+                    pass
+                finally:
+                    if fd >= 0:
+                        os.close(fd)
+                    pending.task_done()
+
+        pending.put(str(directory))
+        with ThreadPoolExecutor(max_workers=WALK_WORKERS) as pool:
+            for _ in range(WALK_WORKERS):
+                pool.submit(walk)
+            pending.join()
+            for _ in range(WALK_WORKERS):
+                pending.put(None)
 
         # Sort by path for consistent ordering
+        audio_files = [match for matches in found for match in matches]
         audio_files.sort()
         return audio_files
 
     def cancel(self) -> None:
         """Request cancellation of ongoing scan."""
-        self._cancel_requested = True
+        self._cancel.set()
+
+
+def _prefetch_headers(paths: list[str], window: threading.Semaphore, stop: threading.Event) -> None:
+    """Advise the kernel to read each file's header ahead of the extraction workers."""
+    for path in paths:
+        window.acquire()
+        if stop.is_set():
+            return
+        try:
+            fd = os.open(path, os.O_RDONLY | getattr(os, "O_CLOEXEC", 0))
+        except OSError:
+            continue
+        try:
+            os.posix_fadvise(fd, 0, PREFETCH_BYTES, os.POSIX_FADV_WILLNEED)
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
+
+
+def _extract_track_tuple(filepath: str, mtime: float, size: int) -> tuple[dict, float] | None:
+    """Read one file's cache row (runs in a worker process)."""
+    try:
+        track = Track.from_file(filepath, file_size=size)
+        return track.to_cache_dict(), mtime
+    except Exception:
+        # Skip files that can't be read
+        return None
 
 
 def scan_directory(path: str | Path) -> list[Track]:
@@ -1,16 +1,19 @@
 """Track metadata reading using mutagen."""
 
+import base64
+import os
+import sqlite3
 from dataclasses import dataclass, field
 from pathlib import Path
 
 from mutagen import File
-from mutagen.flac import FLAC
+from mutagen.flac import FLAC, Picture
 from mutagen.mp3 import MP3
 from mutagen.oggvorbis import OggVorbis
 from mutagen.mp4 import MP4
 
 
-@dataclass
+@dataclass(slots=True)
 class Track:
     """Represents an audio track with metadata."""
 
@@ -28,30 +31,35 @@ class Track:
     bit_depth: int = 0  # bits (for lossless)
     favorite: bool = False  # user favorite flag (not from file metadata)
     album_art: bytes | None = field(default=None, repr=False)
+    art_span: tuple[int, int] | None = field(default=None, repr=False)  # (offset, length) of embedded art
+    filepath_str: str = field(init=False, repr=False, compare=False)  # str(filepath), computed once
+
+    def __post_init__(self):
+        self.filepath_str = str(self.filepath)
 
     @classmethod
-    def from_cache(cls, data: dict) -> "Track":
+    def from_cache(cls, data: sqlite3.Row) -> "Track":
         """Create a Track from cached database row (no file I/O)."""
         return cls(
             filepath=Path(data["filepath"]),
-            title=data.get("title", "Unknown"),
-            artist=data.get("artist", "Unknown"),
-            album=data.get("album", "Unknown"),
-            year=data.get("year", ""),
-            genre=data.get("genre", ""),
-            track_number=data.get("track_number", 0),
-            duration=data.get("duration", 0.0),
-            codec=data.get("codec", "Unknown"),
-            bitrate=data.get("bitrate", 0),
-            sample_rate=data.get("sample_rate", 0),
-            bit_depth=data.get("bit_depth", 0),
+            title=data["title"],
+            artist=data["artist"],
+            album=data["album"],
+            year=data["year"],
+            genre=data["genre"],
+            track_number=data["track_number"],
+            duration=data["duration"],
+            codec=data["codec"],
+            bitrate=data["bitrate"],
+            sample_rate=data["sample_rate"],
+            bit_depth=data["bit_depth"],
             album_art=None,  # Not cached, extracted on-demand
         )
 
     def to_cache_dict(self) -> dict:
         """Convert Track to dict for database storage."""
         return {
-            "filepath": str(self.filepath),
+            "filepath": self.filepath_str,
             "title": self.title,
             "artist": self.artist,
             "album": self.album,
@@ -70,15 +78,23 @@ class Track:
         if self.album_art is not None:
             return
         try:
-            audio = File(str(self.filepath))
-            if audio:
-                self.album_art = _extract_album_art(audio)
+            with open(self.filepath, "rb") as f:
+                # Read located art straight from the file; only parse tags if that fails
+                span = self.art_span or _locate_flac_picture(f.fileno())
+                if span:
+                    self.art_span = span
+                    offset, length = span
+                    self.album_art = os.pread(f.fileno(), length, offset)
+                    return
+                audio = File(f)
+                if audio:
+                    self.album_art = _extract_album_art(audio)
         except Exception:
             pass
 
     @classmethod
-    def from_file(cls, filepath: str | Path) -> "Track":
-        """Create a Track from an audio file path."""
+    def from_file(cls, filepath: str | Path, file_size: int | None = None) -> "Track":
+        """Create a Track from an audio file path (album art is left to load_album_art)."""
         path = Path(filepath)
         track = cls(filepath=path)
 
@@ -87,28 +103,23 @@ class Track:
             if audio is None:
                 return track
 
-            # Extract common metadata
-            track.title = _get_tag(audio, ["title", "TIT2", "\xa9nam"], path.stem)
-            track.artist = _get_tag(audio, ["artist", "TPE1", "\xa9ART"], "Unknown")
-            track.album = _get_tag(audio, ["album", "TALB", "\xa9alb"], "Unknown")
-            track.year = _get_tag(audio, ["date", "TDRC", "\xa9day"], "")[:4]  # Just year
-            track.genre = _get_tag(audio, ["genre", "TCON", "\xa9gen"], "")
+            # Extract common metadata, using the known tag keys for this format
+            keys = _TAG_KEYS.get(type(audio), _TAG_KEY_CANDIDATES)
+            track.title = _get_tag(audio, keys["title"], path.stem)
+            track.artist = _get_tag(audio, keys["artist"], "Unknown")
+            track.album = _get_tag(audio, keys["album"], "Unknown")
+            track.year = _get_tag(audio, keys["date"], "")[:4]  # Just year
+            track.genre = _get_tag(audio, keys["genre"], "")
 
             # Track number
-            track_num = _get_tag(audio, ["tracknumber", "TRCK", "trkn"], "0")
-            if isinstance(track_num, tuple):
-                track_num = track_num[0]
-            track.track_number = _parse_track_number(str(track_num))
+            track.track_number = _parse_track_number(_get_tag(audio, keys["tracknumber"], "0"))
 
             # Duration
             if audio.info:
                 track.duration = audio.info.length or 0.0
 
             # Codec-specific metadata
-            track.codec, track.bitrate, track.sample_rate, track.bit_depth = _get_audio_info(audio, path)
-
-            # Album art
-            track.album_art = _extract_album_art(audio)
+            track.codec, track.bitrate, track.sample_rate, track.bit_depth = _get_audio_info(audio, path, file_size)
 
         except Exception:
             # Return track with defaults if metadata extraction fails
@@ -147,27 +158,81 @@ class Track:
         return " / ".join(parts)
 
 
-def _get_tag(audio, keys: list[str], default: str) -> str:
-    """Get tag value trying multiple possible keys."""
-    for key in keys:
-        value = audio.get(key)
+_VORBIS_KEYS = {
+    "title": "title",
+    "artist": "artist",
+    "album": "album",
+    "date": "date",
+    "genre": "genre",
+    "tracknumber": "tracknumber",
+}
+
+# Tag key per field for formats where it is fixed
+_TAG_KEYS: dict[type, dict[str, str]] = {
+    FLAC: _VORBIS_KEYS,
+    OggVorbis: _VORBIS_KEYS,
+    MP3: {
+        "title": "TIT2",
+        "artist": "TPE1",
+        "album": "TALB",
+        "date": "TDRC",
+        "genre": "TCON",
+        "tracknumber": "TRCK",
+    },
+    MP4: {
+        "title": "\xa9nam",
+        "artist": "\xa9ART",
+        "album": "\xa9alb",
+        "date": "\xa9day",
+        "genre": "\xa9gen",
+        "tracknumber": "trkn",
+    },
+}
+
+# Keys to try in turn for any other format
+_TAG_KEY_CANDIDATES: dict[str, list[str]] = {
+    "title": ["title", "TIT2", "\xa9nam"],
+    "artist": ["artist", "TPE1", "\xa9ART"],
+    "album": ["album", "TALB", "\xa9alb"],
+    "date": ["date", "TDRC", "\xa9day"],
+    "genre": ["genre", "TCON", "\xa9gen"],
+    "tracknumber": ["tracknumber", "TRCK", "trkn"],
+}
+
+
+def _get_tag(audio, keys: str | list[str], default: str) -> str:
+    """Get tag value for a key, or the first of several possible keys."""
+    for key in (keys,) if isinstance(keys, str) else keys:
+        try:
+            value = audio.get(key)
+        except ValueError:
+            # Key not valid for this tag format (e.g. non-ASCII Vorbis key)
+            continue
         if value:
             if isinstance(value, list):
-                return str(value[0])
+                value = value[0]
+            if isinstance(value, tuple):
+                # MP4 (number, total) pairs
+                value = value[0]
             return str(value)
     return default
 
 
 def _parse_track_number(value: str) -> int:
     """Parse track number from various formats (e.g., '5', '5/12')."""
+    if value.isdecimal():
+        return int(value)
+    slash = value.find("/")
+    if slash >= 0:
+        value = value[:slash]
     try:
-        return int(value.split("/")[0].strip())
-    except (ValueError, IndexError):
+        return int(value)
+    except ValueError:
         return 0
 
 
-def _get_audio_info(audio, path: Path) -> tuple[str, int, int, int]:
-    """Extract codec, bitrate, sample rate, bit depth from audio file."""
+def _get_audio_info(audio, path: Path, file_size: int | None = None) -> tuple[str, int, int, int]:
+    """Extract codec, bitrate, sample rate, bit depth from audio file (file_size saves a stat)."""
     codec = "Unknown"
     bitrate = 0
     sample_rate = 0
@@ -182,7 +247,9 @@ def _get_audio_info(audio, path: Path) -> tuple[str, int, int, int]:
             bit_depth = audio.info.bits_per_sample
             # Calculate average bitrate for FLAC
             if audio.info.length > 0:
-                bitrate = int((path.stat().st_size * 8) / audio.info.length / 1000)
+                if file_size is None:
+                    file_size = path.stat().st_size
+                bitrate = int((file_size * 8) / audio.info.length / 1000)
     elif isinstance(audio, MP3):
         codec = "MP3"
         if audio.info:
@@ -218,34 +285,55 @@ def _get_audio_info(audio, path: Path) -> tuple[str, int, int, int]:
     return codec, bitrate, sample_rate, bit_depth
 
 
+def _locate_flac_picture(fd: int) -> tuple[int, int] | None:
+    """Find (offset, length) of the first FLAC picture by walking metadata block headers."""
+    if os.pread(fd, 4, 0) != b"fLaC":
+        return None
+
+    pos = 4
+    while True:
+        header = os.pread(fd, 4, pos)
+        if len(header) < 4:
+            return None
+        pos += 4
+        if header[0] & 0x7F == 6:
+            # PICTURE: type, MIME, description, 16 bytes of dimensions, data length, data
+            mime_len = int.from_bytes(os.pread(fd, 4, pos + 4), "big")
+            desc_pos = pos + 8 + mime_len
+            desc_len = int.from_bytes(os.pread(fd, 4, desc_pos), "big")
+            length_pos = desc_pos + 4 + desc_len + 16
+            length = int.from_bytes(os.pread(fd, 4, length_pos), "big")
+            return length_pos + 4, length
+        if header[0] & 0x80:
+            # Last metadata block
+            return None
+        pos += int.from_bytes(header[1:4], "big")
+
+
 def _extract_album_art(audio) -> bytes | None:
     """Extract embedded album art from audio file."""
     try:
-        # FLAC
-        if isinstance(audio, FLAC) and audio.pictures:
-            return audio.pictures[0].data
-
+        # Most common formats first; each returns as soon as it knows there's no art
         # MP3 (ID3)
         if isinstance(audio, MP3):
-            for key in audio.keys():
-                if key.startswith("APIC"):
-                    return audio[key].data
+            frames = audio.tags.getall("APIC") if audio.tags else None
+            return frames[0].data if frames else None
+
+        # FLAC
+        if isinstance(audio, FLAC):
+            return audio.pictures[0].data if audio.pictures else None
 
         # MP4/M4A
         if isinstance(audio, MP4):
             covers = audio.get("covr")
-            if covers:
-                return bytes(covers[0])
+            return bytes(covers[0]) if covers else None
 
         # OGG Vorbis (base64 encoded FLAC picture)
         if isinstance(audio, OggVorbis):
             pictures = audio.get("metadata_block_picture")
-            if pictures:
-                import base64
-                from mutagen.flac import Picture
-                data = base64.b64decode(pictures[0])
-                picture = Picture(data)
-                return picture.data
+            if not pictures:
+                return None
+            return Picture(base64.b64decode(pictures[0])).data
 
     except Exception:
         pass
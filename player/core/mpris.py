@@ -11,9 +11,12 @@ References:
 - https://wiki.archlinux.org/title/MPRIS
 """
 
+import hashlib
 import tempfile
 import os
+from collections import OrderedDict
 from pathlib import Path
+from typing import Any, Callable
 
 import dbus
 import dbus.service
@@ -29,6 +32,30 @@ DBUS_PROPERTIES_INTERFACE = "org.freedesktop.DBus.Properties"
 # Bus name for our player
 BUS_NAME = "org.mpris.MediaPlayer2.wired"
 
+# Maximum number of cover files kept in the temp art directory
+ART_CACHE_LIMIT = 500
+
+# org.mpris.MediaPlayer2 properties (all constant)
+ROOT_PROPERTIES = {
+    "CanQuit": True,
+    "CanRaise": True,
+    "CanSetFullscreen": False,
+    "Fullscreen": False,
+    "HasTrackList": False,
+    "Identity": "Wired",
+    "DesktopEntry": "wired",
+    "SupportedUriSchemes": dbus.Array(["file"], signature="s"),
+    "SupportedMimeTypes": dbus.Array([
+        "audio/mpeg",
+        "audio/flac",
+        "audio/ogg",
+        "audio/wav",
+        "audio/x-wav",
+        "audio/mp4",
+        "audio/x-m4a",
+    ], signature="s"),
+}
+
 
 class MPRIS2Service(dbus.service.Object):
     """
@@ -66,9 +93,47 @@ class MPRIS2Service(dbus.service.Object):
         self._art_dir.mkdir(exist_ok=True)
         self._current_art_path: Path | None = None
 
+        # Art files by content hash, least recently used first (seeded from earlier runs)
+        self._art_files: OrderedDict[str, Path] = OrderedDict()
+        try:
+            existing = sorted(self._art_dir.glob("art_*.jpg"), key=lambda p: p.stat().st_mtime)
+        except OSError:
+            existing = []
+        for art_path in existing:
+            self._art_files[art_path.stem.removeprefix("art_")] = art_path
+        self._prune_art_files()
+
+        # Metadata for the current track, rebuilt only in update_track
+        self._metadata: dbus.Dictionary | None = None
+
+        # Property getters per interface, so Get doesn't build every property
+        self._properties: dict[str, dict[str, Callable[[], Any]]] = {
+            MPRIS2_INTERFACE: {name: (lambda v=value: v) for name, value in ROOT_PROPERTIES.items()},
+            MPRIS2_PLAYER_INTERFACE: {
+                "PlaybackStatus": lambda: self._playback_status,
+                "LoopStatus": lambda: "None",
+                "Rate": lambda: 1.0,
+                "Shuffle": lambda: False,
+                "Metadata": self._get_metadata,
+                "Volume": lambda: self._volume,
+                "Position": lambda: dbus.Int64(self._position),
+                "MinimumRate": lambda: 1.0,
+                "MaximumRate": lambda: 1.0,
+                "CanGoNext": lambda: True,
+                "CanGoPrevious": lambda: True,
+                "CanPlay": lambda: True,
+                "CanPause": lambda: True,
+                "CanSeek": lambda: True,
+                "CanControl": lambda: True,
+            },
+        }
+
     def update_track(self, track: Track | None):
         """Update current track metadata."""
-        self._current_track = track
+        if track is not self._current_track:
+            # Same Track object (e.g. replayed) keeps its already-built metadata
+            self._current_track = track
+            self._metadata = None
         self._emit_properties_changed(
             MPRIS2_PLAYER_INTERFACE,
             {"Metadata": self._get_metadata()}
@@ -103,41 +168,48 @@ class MPRIS2Service(dbus.service.Object):
         )
 
     def _get_metadata(self) -> dbus.Dictionary:
+        """Get metadata dictionary for current track (built once per track)."""
+        if self._metadata is None:
+            self._metadata = self._build_metadata()
+        return self._metadata
+
+    def _build_metadata(self) -> dbus.Dictionary:
         """Build metadata dictionary for current track."""
-        metadata = dbus.Dictionary(signature="sv")
+        track = self._current_track
+        if not track:
+            return dbus.Dictionary(signature="sv")
 
-        if self._current_track:
-            track = self._current_track
+        # Collect plain values and wrap in a dbus.Dictionary once at the end
+        metadata: dict[str, Any] = {
             # Required: track ID (D-Bus object path)
-            track_id = f"/org/wired/track/{abs(hash(str(track.filepath)))}"
-            metadata["mpris:trackid"] = dbus.ObjectPath(track_id)
-
-            # Track length in microseconds
-            if track.duration > 0:
-                metadata["mpris:length"] = dbus.Int64(int(track.duration * 1_000_000))
+            "mpris:trackid": dbus.ObjectPath(f"/org/wired/track/{_track_digest(track)}"),
+            # File URL
+            "xesam:url": f"file://{track.filepath}",
+        }
 
-            # Standard metadata fields
-            if track.title and track.title != "Unknown":
-                metadata["xesam:title"] = track.title
+        # Track length in microseconds
+        if track.duration > 0:
+            metadata["mpris:length"] = dbus.Int64(int(track.duration * 1_000_000))
 
-            if track.artist and track.artist != "Unknown":
-                metadata["xesam:artist"] = dbus.Array([track.artist], signature="s")
+        # Standard metadata fields
+        if track.title and track.title != "Unknown":
+            metadata["xesam:title"] = track.title
 
-            if track.album and track.album != "Unknown":
-                metadata["xesam:album"] = track.album
+        if track.artist and track.artist != "Unknown":
+            metadata["xesam:artist"] = dbus.Array([track.artist], signature="s")
 
-            if track.year:
-                metadata["xesam:contentCreated"] = track.year
+        if track.album and track.album != "Unknown":
+            metadata["xesam:album"] = track.album
 
-            # File URL
-            metadata["xesam:url"] = f"file://{track.filepath}"
+        if track.year:
+            metadata["xesam:contentCreated"] = track.year
 
-            # Album art - extract to temp file for MPRIS
-            art_url = self._get_album_art_url(track)
-            if art_url:
-                metadata["mpris:artUrl"] = art_url
+        # Album art - extract to temp file for MPRIS
+        art_url = self._get_album_art_url(track)
+        if art_url:
+            metadata["mpris:artUrl"] = art_url
 
-        return metadata
+        return dbus.Dictionary(metadata, signature="sv")
 
     def _get_album_art_url(self, track: Track) -> str | None:
         """Extract album art to temp file and return file:// URL."""
@@ -145,19 +217,33 @@ class MPRIS2Service(dbus.service.Object):
             return None
 
         try:
-            # Create unique filename based on track path hash
-            art_hash = abs(hash(str(track.filepath)))
-            art_path = self._art_dir / f"art_{art_hash}.jpg"
-
-            # Only write if not already cached
-            if not art_path.exists():
-                art_path.write_bytes(track.album_art)
+            # Name by content hash so tracks sharing a cover share one file
+            art_hash = hashlib.blake2b(track.album_art, digest_size=8).hexdigest()
+            art_path = self._art_files.get(art_hash)
+            if art_path is not None:
+                self._art_files.move_to_end(art_hash)
+            else:
+                art_path = self._art_dir / f"art_{art_hash}.jpg"
+                # Only write if not already cached
+                if not art_path.exists():
+                    art_path.write_bytes(track.album_art)
+                self._art_files[art_hash] = art_path
+                self._prune_art_files()
 
             self._current_art_path = art_path
             return f"file://{art_path}"
         except Exception:
             return None
 
+    def _prune_art_files(self):
+        """Delete least recently used art files beyond ART_CACHE_LIMIT."""
+        while len(self._art_files) > ART_CACHE_LIMIT:
+            _, art_path = self._art_files.popitem(last=False)
+            try:
+                art_path.unlink(missing_ok=True)
+            except OSError:
+                pass
+
     def _emit_properties_changed(self, interface: str, changed: dict):
         """Emit PropertiesChanged signal."""
         self.PropertiesChanged(
@@ -248,47 +334,8 @@ class MPRIS2Service(dbus.service.Object):
     @dbus.service.method(DBUS_PROPERTIES_INTERFACE, in_signature="s", out_signature="a{sv}")
     def GetAll(self, interface: str) -> dbus.Dictionary:
         """Get all properties for an interface."""
-        if interface == MPRIS2_INTERFACE:
-            return dbus.Dictionary({
-                "CanQuit": True,
-                "CanRaise": True,
-                "CanSetFullscreen": False,
-                "Fullscreen": False,
-                "HasTrackList": False,
-                "Identity": "Wired",
-                "DesktopEntry": "wired",
-                "SupportedUriSchemes": dbus.Array(["file"], signature="s"),
-                "SupportedMimeTypes": dbus.Array([
-                    "audio/mpeg",
-                    "audio/flac",
-                    "audio/ogg",
-                    "audio/wav",
-                    "audio/x-wav",
-                    "audio/mp4",
-                    "audio/x-m4a",
-                ], signature="s"),
-            }, signature="sv")
-
-        elif interface == MPRIS2_PLAYER_INTERFACE:
-            return dbus.Dictionary({
-                "PlaybackStatus": self._playback_status,
-                "LoopStatus": "None",
-                "Rate": 1.0,
-                "Shuffle": False,
-                "Metadata": self._get_metadata(),
-                "Volume": self._volume,
-                "Position": dbus.Int64(self._position),
-                "MinimumRate": 1.0,
-                "MaximumRate": 1.0,
-                "CanGoNext": True,
-                "CanGoPrevious": True,
-                "CanPlay": True,
-                "CanPause": True,
-                "CanSeek": True,
-                "CanControl": True,
-            }, signature="sv")
-
-        return dbus.Dictionary({}, signature="sv")
+        getters = self._properties.get(interface, {})
+        return dbus.Dictionary({name: get() for name, get in getters.items()}, signature="sv")
 
     @dbus.service.method(DBUS_PROPERTIES_INTERFACE, in_signature="ssv")
     def Set(self, interface: str, prop: str, value):
@@ -299,9 +346,9 @@ class MPRIS2Service(dbus.service.Object):
 
     def _get_property(self, interface: str, prop: str):
         """Get a single property value."""
-        props = self.GetAll(interface)
-        if prop in props:
-            return props[prop]
+        getter = self._properties.get(interface, {}).get(prop)
+        if getter is not None:
+            return getter()
         raise dbus.exceptions.DBusException(
             f"Property {prop} not found on interface {interface}"
         )
@@ -317,6 +364,11 @@ class MPRIS2Service(dbus.service.Object):
         pass
 
 
+def _track_digest(track: Track) -> str:
+    """Stable short hex ID for a track's path (unlike hash(), not randomized per run)."""
+    return hashlib.blake2b(track.filepath_str.encode(), digest_size=8).hexdigest()
+
+
 def create_mpris_service(app) -> MPRIS2Service | None:
     """
     Create and return MPRIS2 service instance.
@@ -1,14 +1,16 @@
 """Playlist data structure for managing track collections."""
 
 import random
+from operator import itemgetter
 from typing import Callable
 
 from PyQt6.QtCore import QObject, pyqtSignal
 
 from player.core.metadata import Track
+from player.core.signals import BatchedSignals
 
 
-class Playlist(QObject):
+class Playlist(QObject, BatchedSignals):
     """Manages a collection of tracks with navigation."""
 
     current_changed = pyqtSignal(int)  # index of new current track
@@ -21,6 +23,8 @@ class Playlist(QObject):
         self._tracks: list[Track] = []
         self._current_index: int = -1
         self._shuffle_order: list[int] | None = None
+        self._shuffle_pos: dict[int, int] | None = None  # track index -> position in shuffle order
+        self._upcoming: tuple[int, int, list[Track]] | None = None  # (current index, count, result)
 
     @property
     def tracks(self) -> list[Track]:
@@ -41,29 +45,45 @@ class Playlist(QObject):
     def add_track(self, track: Track) -> None:
         """Add a track to the playlist."""
         self._tracks.append(track)
-        self.tracks_changed.emit()
+        self._upcoming = None
+        self._emit("tracks_changed")
 
     def add_tracks(self, tracks: list[Track]) -> None:
         """Add multiple tracks to the playlist."""
         self._tracks.extend(tracks)
-        self.tracks_changed.emit()
+        self._upcoming = None
+        self._emit("tracks_changed")
 
     def remove_track(self, index: int) -> None:
         """Remove track at index."""
         if 0 <= index < len(self._tracks):
             self._tracks.pop(index)
-            if self._current_index >= len(self._tracks):
-                self._current_index = len(self._tracks) - 1
-            elif self._current_index > index:
-                self._current_index -= 1
-            self.tracks_changed.emit()
+            # Shift down if after the removed track, clamp if it was the last one
+            self._current_index = min(self._current_index - (self._current_index > index), len(self._tracks) - 1)
+            if self._shuffle_order is not None:
+                # Drop the removed index and renumber the ones after it
+                self._shuffle_order = [i - (i > index) for i in self._shuffle_order if i != index]
+                self._shuffle_pos = None
+            self._upcoming = None
+            self._emit("tracks_changed")
+
+    def relink_tracks(self, path_to_track: dict[str, Track]) -> None:
+        """Swap in the library's current Track objects, matched by file path."""
+        get = path_to_track.get
+        tracks = [get(t.filepath_str, t) for t in self._tracks]
+        if any(new is not old for new, old in zip(tracks, self._tracks)):
+            self._tracks[:] = tracks
+            self._upcoming = None
+            self._emit("tracks_changed")
 
     def clear(self) -> None:
         """Remove all tracks."""
         self._tracks.clear()
         self._current_index = -1
         self._shuffle_order = None
-        self.tracks_changed.emit()
+        self._shuffle_pos = None
+        self._upcoming = None
+        self._emit("tracks_changed")
 
     def get_current(self) -> Track | None:
         """Get the currently selected track."""
@@ -75,7 +95,7 @@ class Playlist(QObject):
         """Set current track by index."""
         if 0 <= index < len(self._tracks):
             self._current_index = index
-            self.current_changed.emit(index)
+            self._emit("current_changed", index)
             return self._tracks[index]
         return None
 
@@ -86,17 +106,17 @@ class Playlist(QObject):
 
         if self._shuffle_order:
             # Shuffle mode
-            try:
-                current_shuffle_idx = self._shuffle_order.index(self._current_index)
+            current_shuffle_idx = self._shuffle_position()
+            if current_shuffle_idx is not None:
                 next_shuffle_idx = (current_shuffle_idx + 1) % len(self._shuffle_order)
                 self._current_index = self._shuffle_order[next_shuffle_idx]
-            except ValueError:
-                self._current_index = self._shuffle_order[0] if self._shuffle_order else 0
+            else:
+                self._current_index = self._shuffle_order[0]
         else:
             # Normal mode
             self._current_index = (self._current_index + 1) % len(self._tracks)
 
-        self.current_changed.emit(self._current_index)
+        self._emit("current_changed", self._current_index)
         return self._tracks[self._current_index]
 
     def previous(self) -> Track | None:
@@ -106,31 +126,46 @@ class Playlist(QObject):
 
         if self._shuffle_order:
             # Shuffle mode
-            try:
-                current_shuffle_idx = self._shuffle_order.index(self._current_index)
+            current_shuffle_idx = self._shuffle_position()
+            if current_shuffle_idx is not None:
                 prev_shuffle_idx = (current_shuffle_idx - 1) % len(self._shuffle_order)
                 self._current_index = self._shuffle_order[prev_shuffle_idx]
-            except ValueError:
-                self._current_index = self._shuffle_order[0] if self._shuffle_order else 0
+            else:
+                self._current_index = self._shuffle_order[0]
         else:
             # Normal mode
             self._current_index = (self._current_index - 1) % len(self._tracks)
 
-        self.current_changed.emit(self._current_index)
+        self._emit("current_changed", self._current_index)
         return self._tracks[self._current_index]
 
     def shuffle(self, enabled: bool = True) -> None:
         """Enable or disable shuffle mode."""
         if enabled:
-            self._shuffle_order = list(range(len(self._tracks)))
-            random.shuffle(self._shuffle_order)
-            # Put current track at start of shuffle
-            if self._current_index >= 0 and self._current_index in self._shuffle_order:
-                self._shuffle_order.remove(self._current_index)
-                self._shuffle_order.insert(0, self._current_index)
+            n = len(self._tracks)
+            order = list(range(n))
+            # Put current track at start of shuffle and shuffle only the rest
+            start = 0
+            if 0 <= self._current_index < n:
+                order[0], order[self._current_index] = self._current_index, 0
+                start = 1
+            # Durstenfeld (Fisher-Yates) shuffle of order[start:]
+            randrange = random.randrange
+            for i in range(n - 1, start, -1):
+                j = randrange(start, i + 1)
+                order[i], order[j] = order[j], order[i]
+            self._shuffle_order = order
         else:
             self._shuffle_order = None
-        self.shuffle_changed.emit(enabled)
+        self._shuffle_pos = None
+        self._upcoming = None
+        self._emit("shuffle_changed", enabled)
+
+    def _shuffle_position(self) -> int | None:
+        """Get the current track's position in the shuffle order (None if absent)."""
+        if self._shuffle_pos is None:
+            self._shuffle_pos = {track: pos for pos, track in enumerate(self._shuffle_order)}
+        return self._shuffle_pos.get(self._current_index)
 
     def is_shuffled(self) -> bool:
         """Check if shuffle is enabled."""
@@ -141,24 +176,31 @@ class Playlist(QObject):
         if not self._tracks or self._current_index < 0:
             return []
 
-        upcoming = []
+        # Reuse the last result until the position, contents or shuffle order change
+        cached = self._upcoming
+        if cached is not None and cached[0] == self._current_index and cached[1] == count:
+            return list(cached[2])
+        upcoming = self._compute_upcoming(count)
+        self._upcoming = (self._current_index, count, upcoming)
+        return list(upcoming)
+
+    def _compute_upcoming(self, count: int) -> list[Track]:
+        """Build the upcoming-track list for get_upcoming_tracks."""
         total = len(self._tracks)
+        count = min(count, total - 1)
 
+        # The next `count` entries after the current one, wrapping around once
         if self._shuffle_order:
-            try:
-                current_pos = self._shuffle_order.index(self._current_index)
-            except ValueError:
+            order = self._shuffle_order
+            current_pos = self._shuffle_position()
+            if current_pos is None:
                 current_pos = 0
-            for i in range(1, min(count + 1, total)):
-                next_pos = (current_pos + i) % len(self._shuffle_order)
-                track_idx = self._shuffle_order[next_pos]
-                upcoming.append(self._tracks[track_idx])
-        else:
-            for i in range(1, min(count + 1, total)):
-                next_idx = (self._current_index + i) % total
-                upcoming.append(self._tracks[next_idx])
+            start = current_pos + 1
+            indices = order[start:start + count] + order[:max(0, start + count - len(order))]
+            return [self._tracks[i] for i in indices]
 
-        return upcoming
+        start = self._current_index + 1
+        return self._tracks[start:start + count] + self._tracks[:max(0, start + count - total)]
 
     def sort(self, key: str, reverse: bool = False) -> None:
         """Sort tracks by a given attribute."""
@@ -174,13 +216,19 @@ class Playlist(QObject):
         }
 
         if key in key_funcs:
-            self._tracks.sort(key=key_funcs[key], reverse=reverse)
+            # Decorate with each track's key and old index, sort stably on the key only
+            key_func = key_funcs[key]
+            decorated = [(key_func(t), i) for i, t in enumerate(self._tracks)]
+            decorated.sort(key=itemgetter(0), reverse=reverse)
+            old_tracks = self._tracks
+            self._tracks = [old_tracks[i] for _, i in decorated]
 
             # Update current index to follow the track
             if current_track:
-                try:
-                    self._current_index = self._tracks.index(current_track)
-                except ValueError:
-                    self._current_index = -1
+                old_index = self._current_index
+                self._current_index = next(
+                    (pos for pos, (_, i) in enumerate(decorated) if i == old_index), -1
+                )
 
-            self.tracks_changed.emit()
+            self._upcoming = None
+            self._emit("tracks_changed")
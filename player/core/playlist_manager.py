@@ -1,13 +1,19 @@
 """Manager for saved playlists."""
 
+import os
+import sqlite3
 from dataclasses import dataclass
 from datetime import datetime
+from operator import attrgetter
 from pathlib import Path
 
 from PyQt6.QtCore import QObject, pyqtSignal
 
 from player.core.database import LibraryDatabase
 from player.core.metadata import Track
+from player.core.signals import BatchedSignals
+
+_filepath_str = attrgetter("filepath_str")
 
 
 @dataclass
@@ -21,7 +27,7 @@ class SavedPlaylist:
     track_count: int = 0
 
     @classmethod
-    def from_db(cls, data: dict, track_count: int = 0) -> "SavedPlaylist":
+    def from_db(cls, data: sqlite3.Row, track_count: int = 0) -> "SavedPlaylist":
         return cls(
             id=data["id"],
             name=data["name"],
@@ -31,7 +37,7 @@ class SavedPlaylist:
         )
 
 
-class PlaylistManager(QObject):
+class PlaylistManager(QObject, BatchedSignals):
     """Manages saved playlists stored in SQLite."""
 
     # Signals
@@ -41,38 +47,36 @@ class PlaylistManager(QObject):
     def __init__(self, database: LibraryDatabase):
         super().__init__()
         self._db = database
+        # (library list, its length, filepath -> Track) for the last library seen
+        self._path_cache: tuple[list[Track], int, dict[str, Track]] | None = None
 
     def get_all(self) -> list[SavedPlaylist]:
         """Get all playlists with track counts."""
-        playlists = []
-        for data in self._db.get_all_playlists():
-            count = self._db.get_playlist_track_count(data["id"])
-            playlists.append(SavedPlaylist.from_db(data, count))
-        return playlists
+        # Counts come from the playlists rows themselves, so this is one query
+        return [SavedPlaylist.from_db(data, data["track_count"]) for data in self._db.get_all_playlists()]
 
     def get(self, playlist_id: str) -> SavedPlaylist | None:
         """Get a playlist by ID."""
         data = self._db.get_playlist(playlist_id)
         if data:
-            count = self._db.get_playlist_track_count(playlist_id)
-            return SavedPlaylist.from_db(data, count)
+            return SavedPlaylist.from_db(data, data["track_count"])
         return None
 
     def create(self, name: str) -> SavedPlaylist:
         """Create a new empty playlist."""
         playlist_id = self._db.create_playlist(name)
-        self.playlists_changed.emit()
+        self._emit("playlists_changed")
         return self.get(playlist_id)
 
     def rename(self, playlist_id: str, name: str) -> None:
         """Rename a playlist."""
         self._db.rename_playlist(playlist_id, name)
-        self.playlists_changed.emit()
+        self._emit("playlists_changed")
 
     def delete(self, playlist_id: str) -> None:
         """Delete a playlist."""
         self._db.delete_playlist(playlist_id)
-        self.playlists_changed.emit()
+        self._emit("playlists_changed")
 
     def get_tracks(self, playlist_id: str, library_tracks: list[Track]) -> list[Track]:
         """
@@ -86,48 +90,52 @@ class PlaylistManager(QObject):
             List of Track objects in playlist order
         """
         paths = self._db.get_playlist_tracks(playlist_id)
-        path_to_track = {str(t.filepath): t for t in library_tracks}
+        path_to_track = self._path_map(library_tracks)
 
-        tracks = []
-        for path in paths:
-            if path in path_to_track:
-                tracks.append(path_to_track[path])
-            # Skip missing tracks silently
+        # Skip missing tracks silently
+        return [t for t in map(path_to_track.get, paths) if t is not None]
 
-        return tracks
+    def _path_map(self, library_tracks: list[Track]) -> dict[str, Track]:
+        """Get a filepath -> Track map for the library, rebuilt only when the list changes."""
+        cache = self._path_cache
+        if cache is None or cache[0] is not library_tracks or cache[1] != len(library_tracks):
+            cache = (library_tracks, len(library_tracks), {t.filepath_str: t for t in library_tracks})
+            self._path_cache = cache
+        return cache[2]
 
     def add_tracks(self, playlist_id: str, tracks: list[Track]) -> None:
         """Add tracks to a playlist."""
-        paths = [str(t.filepath) for t in tracks]
+        paths = list(map(_filepath_str, tracks))
         self._db.add_tracks_to_playlist(playlist_id, paths)
-        self.playlist_updated.emit(playlist_id)
+        self._emit("playlist_updated", playlist_id)
 
     def remove_tracks(self, playlist_id: str, tracks: list[Track]) -> None:
         """Remove tracks from a playlist."""
-        paths = [str(t.filepath) for t in tracks]
+        paths = list(map(_filepath_str, tracks))
         self._db.remove_tracks_from_playlist(playlist_id, paths)
-        self.playlist_updated.emit(playlist_id)
+        self._emit("playlist_updated", playlist_id)
 
     def set_tracks(self, playlist_id: str, tracks: list[Track]) -> None:
         """Replace all tracks in a playlist."""
-        paths = [str(t.filepath) for t in tracks]
+        paths = list(map(_filepath_str, tracks))
         self._db.set_playlist_tracks(playlist_id, paths)
-        self.playlist_updated.emit(playlist_id)
+        self._emit("playlist_updated", playlist_id)
 
     def export_m3u(self, playlist_id: str, filepath: Path, library_tracks: list[Track]) -> None:
         """Export a playlist to M3U format."""
         playlist = self.get(playlist_id)
         tracks = self.get_tracks(playlist_id, library_tracks)
 
-        with open(filepath, "w", encoding="utf-8") as f:
-            f.write("#EXTM3U\n")
-            if playlist:
-                f.write(f"#PLAYLIST:{playlist.name}\n")
+        lines = ["#EXTM3U\n"]
+        if playlist:
+            lines.append(f"#PLAYLIST:{playlist.name}\n")
+        lines.extend(
+            f"#EXTINF:{int(t.duration)},{t.artist} - {t.title}\n{t.filepath_str}\n"
+            for t in tracks
+        )
 
-            for track in tracks:
-                duration = int(track.duration)
-                f.write(f"#EXTINF:{duration},{track.artist} - {track.title}\n")
-                f.write(f"{track.filepath}\n")
+        with open(filepath, "w", encoding="utf-8") as f:
+            f.write("".join(lines))
 
     def import_m3u(self, filepath: Path, library_tracks: list[Track]) -> SavedPlaylist | None:
         """
@@ -145,40 +153,48 @@ class PlaylistManager(QObject):
 
         # Parse M3U
         track_paths = []
+        seen: set[str] = set()
         playlist_name = filepath.stem  # Default to filename
 
-        path_to_track = {str(t.filepath): t for t in library_tracks}
-        m3u_dir = filepath.parent
+        path_to_track = self._path_map(library_tracks)
+        m3u_dir = str(filepath.parent)
+
+        # Bind per-line lookups once; the loop runs for every line of the file
+        append = track_paths.append
+        mark_seen = seen.add
+        isabs = os.path.isabs
+        join = os.path.join
+        normpath = os.path.normpath
 
         with open(filepath, "r", encoding="utf-8", errors="ignore") as f:
             for line in f:
-                line = line.strip()
-                if not line or line.startswith("#EXTM3U"):
-                    continue
-                if line.startswith("#PLAYLIST:"):
-                    playlist_name = line[10:].strip()
+                track_path = line.strip()
+                if not track_path:
                     continue
-                if line.startswith("#"):
-                    continue  # Skip other directives
-
-                # This is a track path
-                track_path = line
+                if track_path[0] == "#":
+                    if track_path.startswith("#PLAYLIST:"):
+                        playlist_name = track_path[10:].strip()
+                    continue  # Skip #EXTM3U and other directives
 
                 # Handle relative paths (including ../ style paths)
-                if not Path(track_path).is_absolute():
-                    # Join with m3u directory and resolve to get canonical path
-                    track_path = str((m3u_dir / track_path).resolve())
-
-                # Only add if track exists in library
-                if track_path in path_to_track:
-                    track_paths.append(track_path)
+                if not isabs(track_path):
+                    # Join with m3u directory and normalize lexically; only resolve
+                    # symlinks (slow) if that doesn't match a library path
+                    joined = join(m3u_dir, track_path)
+                    track_path = normpath(joined)
+                    if track_path not in path_to_track:
+                        track_path = str(Path(joined).resolve())
+
+                # Only add if track exists in library, and only once
+                if track_path in path_to_track and track_path not in seen:
+                    mark_seen(track_path)
+                    append(track_path)
 
         if not track_paths:
             return None
 
         # Create playlist
-        playlist_id = self._db.create_playlist(playlist_name)
-        self._db.add_tracks_to_playlist(playlist_id, track_paths)
-        self.playlists_changed.emit()
+        playlist_id = self._db.create_playlist(playlist_name, track_paths)
+        self._emit("playlists_changed")
 
         return self.get(playlist_id)
@@ -1,11 +1,17 @@
 """Playback queue for managing upcoming tracks."""
 
+from collections import deque
+from operator import attrgetter
+
 from PyQt6.QtCore import QObject, pyqtSignal
 
 from player.core.metadata import Track
+from player.core.signals import BatchedSignals
+
+_filepath_str = attrgetter("filepath_str")
 
 
-class PlaybackQueue(QObject):
+class PlaybackQueue(QObject, BatchedSignals):
     """
     Manages a queue of tracks to play next.
 
@@ -17,12 +23,15 @@ class PlaybackQueue(QObject):
 
     def __init__(self):
         super().__init__()
-        self._tracks: list[Track] = []
+        self._tracks: deque[Track] = deque()  # O(1) at both ends for play_next/pop_next
+        self._snapshot: tuple[Track, ...] | None = None  # cached read-only view for `tracks`
 
     @property
-    def tracks(self) -> list[Track]:
-        """Get all tracks in the queue."""
-        return self._tracks.copy()
+    def tracks(self) -> tuple[Track, ...]:
+        """Get all tracks in the queue (read-only snapshot, reused until the queue changes)."""
+        if self._snapshot is None:
+            self._snapshot = tuple(self._tracks)
+        return self._snapshot
 
     def __len__(self) -> int:
         return len(self._tracks)
@@ -39,24 +48,28 @@ class PlaybackQueue(QObject):
 
     def play_next(self, track: Track) -> None:
         """Add track to front of queue (plays next)."""
-        self._tracks.insert(0, track)
-        self.queue_changed.emit()
+        self._tracks.appendleft(track)
+        self._snapshot = None
+        self._emit("queue_changed")
 
     def add_to_queue(self, track: Track) -> None:
         """Add track to end of queue."""
         self._tracks.append(track)
-        self.queue_changed.emit()
+        self._snapshot = None
+        self._emit("queue_changed")
 
     def add_tracks(self, tracks: list[Track]) -> None:
         """Add multiple tracks to end of queue."""
         self._tracks.extend(tracks)
-        self.queue_changed.emit()
+        self._snapshot = None
+        self._emit("queue_changed")
 
     def pop_next(self) -> Track | None:
         """Remove and return the next track from queue."""
         if self._tracks:
-            track = self._tracks.pop(0)
-            self.queue_changed.emit()
+            track = self._tracks.popleft()
+            self._snapshot = None
+            self._emit("queue_changed")
             return track
         return None
 
@@ -67,24 +80,37 @@ class PlaybackQueue(QObject):
     def remove(self, index: int) -> None:
         """Remove track at specified index."""
         if 0 <= index < len(self._tracks):
-            self._tracks.pop(index)
-            self.queue_changed.emit()
+            del self._tracks[index]
+            self._snapshot = None
+            self._emit("queue_changed")
 
     def move(self, from_index: int, to_index: int) -> None:
         """Move track from one position to another."""
         if 0 <= from_index < len(self._tracks) and 0 <= to_index < len(self._tracks):
-            track = self._tracks.pop(from_index)
+            track = self._tracks[from_index]
+            del self._tracks[from_index]
             self._tracks.insert(to_index, track)
-            self.queue_changed.emit()
+            self._snapshot = None
+            self._emit("queue_changed")
+
+    def relink_tracks(self, path_to_track: dict[str, Track]) -> None:
+        """Swap in the library's current Track objects, matched by file path."""
+        get = path_to_track.get
+        tracks = [get(t.filepath_str, t) for t in self._tracks]
+        if any(new is not old for new, old in zip(tracks, self._tracks)):
+            self._tracks = deque(tracks)
+            self._snapshot = None
+            self._emit("queue_changed")
 
     def clear(self) -> None:
         """Remove all tracks from queue."""
         self._tracks.clear()
-        self.queue_changed.emit()
+        self._snapshot = None
+        self._emit("queue_changed")
 
     def get_filepaths(self) -> list[str]:
         """Get list of file paths for persistence."""
-        return [str(t.filepath) for t in self._tracks]
+        return list(map(_filepath_str, self._tracks))
 
     def total_duration(self) -> float:
         """Get total duration of queued tracks in seconds."""
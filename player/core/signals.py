@@ -0,0 +1,38 @@
+"""Coalescing of Qt signal emissions during bulk edits."""
+
+from contextlib import contextmanager
+from typing import Iterator
+
+
+class BatchedSignals:
+    """
+    Mixin for QObjects whose mutators emit change signals.
+
+    Mutators call _emit() instead of signal.emit(). Inside a batch_updates()
+    block emissions are collected and each distinct (signal, args) pair is
+    emitted once when the outermost block exits.
+    """
+
+    _batch_depth = 0
+
+    @contextmanager
+    def batch_updates(self) -> Iterator[None]:
+        """Defer and coalesce signal emissions until the block exits."""
+        if self._batch_depth == 0:
+            self._pending_emits: dict[tuple, None] = {}
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                pending, self._pending_emits = self._pending_emits, {}
+                for name, args in pending:
+                    getattr(self, name).emit(*args)
+
+    def _emit(self, name: str, *args) -> None:
+        """Emit the named signal now, or once at the end of the current batch."""
+        if self._batch_depth:
+            self._pending_emits[(name, args)] = None
+        else:
+            getattr(self, name).emit(*args)
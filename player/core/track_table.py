@@ -0,0 +1,66 @@
+"""Column-oriented view over the library for whole-library sorts."""
+
+from array import array
+
+from player.core.metadata import Track
+
+# Text columns, compared case-insensitively when sorting
+TEXT_COLUMNS = ("filepath", "title", "artist", "album", "year", "genre", "codec")
+
+# Numeric columns and their array typecodes
+NUMERIC_COLUMNS = {
+    "track_number": "l",
+    "duration": "d",
+    "bitrate": "l",
+    "sample_rate": "l",
+    "bit_depth": "l",
+}
+
+
+class TrackTable:
+    """
+    Sort keys for library tracks stored as parallel columns (struct-of-arrays).
+
+    Sorting reads one packed column instead of touching every Track object.
+    Columns are built on first use, only for the fields actually sorted on,
+    and rows map back to the original Track objects.
+    """
+
+    def __init__(self, tracks: list[Track]):
+        self._tracks = tracks
+        self._columns: dict[str, list[str] | array] = {}
+        self._orders: dict[tuple[str, ...], list[int]] = {}
+
+    def _key_column(self, name: str) -> list[str] | array:
+        """Get the sort key column for a field (text lowercased), building it on first use."""
+        column = self._columns.get(name)
+        if column is None:
+            tracks = self._tracks
+            if name == "filepath":
+                column = [t.filepath_str.lower() for t in tracks]
+            elif name in TEXT_COLUMNS:
+                # Rows from older schemas may hold NULL text fields
+                column = [(getattr(t, name) or "").lower() for t in tracks]
+            else:
+                column = array(NUMERIC_COLUMNS[name], (getattr(t, name) or 0 for t in tracks))
+            self._columns[name] = column
+        return column
+
+    def argsort(self, *fields: str) -> list[int]:
+        """Get row indices ordered by the given fields (cached per field tuple)."""
+        order = self._orders.get(fields)
+        if order is None:
+            cols = [self._key_column(f) for f in fields]
+            if len(cols) == 1:
+                col = cols[0]
+                order = sorted(range(len(self._tracks)), key=col.__getitem__)
+            else:
+                keys = list(zip(*cols))
+                order = sorted(range(len(self._tracks)), key=keys.__getitem__)
+            self._orders[fields] = order
+        return order
+
+    def sorted_by(self, *fields: str) -> list[Track]:
+        """Get all tracks ordered by the given fields."""
+        tracks = self._tracks
+        return [tracks[i] for i in self.argsort(*fields)]
@@ -1,29 +1,35 @@
 """Detective dark theme constants and Qt stylesheet."""
 
+import sys
+from functools import cache
+
+# Color constants are interned so equal colors share one object and hash once
+
 # Backgrounds (darkest to lightest)
-BG_PRIMARY = "#0a0a0a"
-BG_SECONDARY = "#0f0f0f"
-BG_TERTIARY = "#1a1a1a"
+BG_PRIMARY = sys.intern("#0a0a0a")
+BG_SECONDARY = sys.intern("#0f0f0f")
+BG_TERTIARY = sys.intern("#1a1a1a")
 
 # Text
-TEXT_NORMAL = "#c0c0c0"
-TEXT_MUTED = "#909090"
-TEXT_DIM = "#606060"
+TEXT_NORMAL = sys.intern("#c0c0c0")
+TEXT_MUTED = sys.intern("#909090")
+TEXT_DIM = sys.intern("#606060")
 
 # Accent (muted green)
-ACCENT = "#4a7c59"
-ACCENT_DIM = "#2d4a38"
+ACCENT = sys.intern("#4a7c59")
+ACCENT_DIM = sys.intern("#2d4a38")
 
 # Borders
-BORDER = "#2a2a2a"
+BORDER = sys.intern("#2a2a2a")
 
 # Selection
 SELECTION_BG = ACCENT
-SELECTION_TEXT = "#ffffff"
+SELECTION_TEXT = sys.intern("#ffffff")
 
 
+@cache
 def get_stylesheet() -> str:
-    """Return the complete Qt stylesheet for the detective theme."""
+    """Return the complete Qt stylesheet for the detective theme (built once)."""
     return f"""
         * {{
             font-family: "IBM Plex Mono", "Consolas", "Monaco", monospace;
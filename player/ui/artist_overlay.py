@@ -1,8 +1,10 @@
 """Artist dossier overlay showing artist info and albums."""
 
+import hashlib
 from dataclasses import dataclass
-from PyQt6.QtCore import Qt, pyqtSignal, QSize
-from PyQt6.QtGui import QPixmap, QKeyEvent, QColor, QPainter, QFont
+from operator import itemgetter
+from PyQt6.QtCore import Qt, pyqtSignal, pyqtSlot, QBuffer, QIODevice, QObject, QRect, QSize, QThread
+from PyQt6.QtGui import QPixmap, QPixmapCache, QImageReader, QKeyEvent, QColor, QPainter, QPen, QFont
 from PyQt6.QtWidgets import (
     QDialog,
     QVBoxLayout,
@@ -11,7 +13,8 @@ from PyQt6.QtWidgets import (
     QFrame,
     QScrollArea,
     QWidget,
-    QGridLayout,
+    QLayout,
+    QLayoutItem,
     QPushButton,
 )
 
@@ -22,8 +25,181 @@ from player.theme.lainchan import (
     ACCENT, ACCENT_DIM, BORDER,
 )
 
-
-@dataclass
+# Single stylesheet for the overlay and its cards, applied once to the dialog.
+# Widgets are matched by object name.
+OVERLAY_STYLESHEET = f"""
+    QFrame#artistContainer {{
+        background-color: {BG_PRIMARY};
+        border: 1px solid {ACCENT};
+    }}
+
+    QFrame#artistHeader {{
+        background-color: {BG_PRIMARY};
+        border: none;
+        border-bottom: 1px solid {BORDER};
+    }}
+    QLabel#artistTitle {{
+        color: {ACCENT};
+        border: none;
+    }}
+
+    QFrame#artistInfo {{
+        background-color: {BG_SECONDARY};
+        border: none;
+        border-bottom: 1px solid {BORDER};
+    }}
+    QLabel#artistName {{
+        color: {TEXT_NORMAL};
+        border: none;
+        background: transparent;
+    }}
+    QLabel#artistStats {{
+        color: {TEXT_MUTED};
+        border: none;
+        background: transparent;
+    }}
+
+    QFrame#albumsHeader {{
+        background-color: {BG_PRIMARY};
+        border: none;
+    }}
+    QLabel#albumsTitle {{
+        color: {TEXT_DIM};
+        border: none;
+    }}
+
+    QScrollArea#albumScroll {{
+        background-color: {BG_PRIMARY};
+        border: none;
+    }}
+    QScrollArea#albumScroll QScrollBar:vertical {{
+        background-color: {BG_PRIMARY};
+        width: 8px;
+        border: none;
+    }}
+    QScrollArea#albumScroll QScrollBar::handle:vertical {{
+        background-color: {BORDER};
+        border-radius: 4px;
+        min-height: 20px;
+    }}
+    QScrollArea#albumScroll QScrollBar::handle:vertical:hover {{
+        background-color: {TEXT_DIM};
+    }}
+    QScrollArea#albumScroll QScrollBar::add-line:vertical,
+    QScrollArea#albumScroll QScrollBar::sub-line:vertical {{
+        height: 0px;
+    }}
+    QWidget#albumsContainer {{
+        background-color: {BG_PRIMARY};
+    }}
+
+    QFrame#albumCard {{
+        background-color: {BG_SECONDARY};
+        border: 1px solid {BORDER};
+    }}
+    QFrame#albumCard:hover {{
+        border-color: {ACCENT};
+        background-color: {BG_TERTIARY};
+    }}
+    QLabel#albumCardArt {{
+        background-color: {BG_PRIMARY};
+        border: 1px solid {BORDER};
+        color: {TEXT_DIM};
+        font-size: 10px;
+    }}
+    QLabel#albumCardName {{
+        color: {TEXT_NORMAL};
+        font-size: 11px;
+        font-weight: bold;
+        background: transparent;
+        border: none;
+    }}
+    QLabel#albumCardInfo {{
+        color: {TEXT_DIM};
+        font-size: 10px;
+        background: transparent;
+        border: none;
+    }}
+
+    QFrame#artistFooter {{
+        background-color: {BG_PRIMARY};
+        border: none;
+        border-top: 1px solid {BORDER};
+    }}
+    QPushButton#playAllButton {{
+        background-color: {ACCENT_DIM};
+        color: {TEXT_NORMAL};
+        border: 1px solid {ACCENT};
+        padding: 6px 16px;
+        font-size: 12px;
+    }}
+    QPushButton#playAllButton:hover {{
+        background-color: {ACCENT};
+    }}
+    QLabel#footerHint {{
+        color: {TEXT_DIM};
+    }}
+    QPushButton#closeButton {{
+        background-color: transparent;
+        color: {TEXT_MUTED};
+        border: 1px solid {BORDER};
+        padding: 6px 16px;
+        font-size: 12px;
+    }}
+    QPushButton#closeButton:hover {{
+        color: {TEXT_NORMAL};
+        border-color: {TEXT_MUTED};
+    }}
+"""
+
+
+def _label_font(pixel_size: int, bold: bool = False, spacing: float = 0) -> QFont:
+    """Build the font for one of the overlay's static labels."""
+    font = QFont()
+    font.setPixelSize(pixel_size)
+    font.setBold(bold)
+    if spacing:
+        font.setLetterSpacing(QFont.SpacingType.AbsoluteSpacing, spacing)
+    return font
+
+
+# Album name -> name elided to card width (every card uses the same font)
+_elided_names: dict[str, str] = {}
+
+
+def _scaled_art(data: bytes) -> QPixmap:
+    """Get album art decoded and scaled to card size, reusing earlier decodes."""
+    # Keyed by content so identical art is shared app-wide via QPixmapCache
+    key = f"art:{hashlib.blake2b(data, digest_size=8).hexdigest()}:124"
+    pixmap = QPixmapCache.find(key)
+    if pixmap is not None:
+        return pixmap
+
+    # Let the image plugin decode straight to ~2x card size (JPEG uses DCT scaling),
+    # so the smooth pass below only filters a small image
+    buffer = QBuffer()
+    buffer.setData(data)
+    buffer.open(QIODevice.OpenModeFlag.ReadOnly)
+    reader = QImageReader(buffer)
+    reader.setAutoTransform(True)
+    size = reader.size()
+    if size.isValid() and (size.width() > 248 or size.height() > 248):
+        reader.setScaledSize(size.scaled(248, 248, Qt.AspectRatioMode.KeepAspectRatio))
+    image = reader.read()
+    if image.isNull():
+        return QPixmap()
+
+    pixmap = QPixmap.fromImage(image)
+    pixmap = pixmap.scaled(
+        124, 124,
+        Qt.AspectRatioMode.KeepAspectRatio,
+        Qt.TransformationMode.SmoothTransformation
+    )
+    QPixmapCache.insert(key, pixmap)
+    return pixmap
+
+
+@dataclass(slots=True)
 class AlbumInfo:
     """Aggregated album information."""
     name: str
@@ -32,12 +208,188 @@ class AlbumInfo:
     total_duration: float
     album_art: bytes | None
     codecs: set[str]
+    tracks: list[Track]  # source of the album art, read lazily
+    art_requested: bool = False  # art load queued (UI thread)
+    art_loaded: bool = False  # art lookup finished (worker thread)
+
+
+def build_artist_index(tracks: list[Track]) -> dict[str, dict[str, list[Track]]]:
+    """Group library tracks by casefolded artist, then by album name."""
+    index: dict[str, dict[str, list[Track]]] = {}
+    for track in tracks:
+        album_name = track.album if track.album and track.album != "Unknown" else "(Singles)"
+        index.setdefault(track.artist.casefold(), {}).setdefault(album_name, []).append(track)
+    return index
+
+
+def build_albums(albums_dict: dict[str, list[Track]]) -> list[AlbumInfo]:
+    """Build album data from an artist's tracks grouped by album."""
+    # (sort key, album) pairs, keyed as the albums are built
+    decorated: list[tuple[tuple[str, str], AlbumInfo]] = []
+    for album_name, album_tracks in albums_dict.items():
+        # One pass for total duration, codecs and first non-empty year.
+        # Album art is read later, once the album's card is on screen.
+        total_duration = 0.0
+        codecs: set[str] = set()
+        year = ""
+        for t in album_tracks:
+            total_duration += t.duration
+            codec = t.codec
+            if codec and codec != "Unknown":
+                codecs.add(codec)
+            if not year and t.year:
+                year = t.year
+
+        decorated.append(((year or "0000", album_name), AlbumInfo(
+            name=album_name,
+            year=year,
+            track_count=len(album_tracks),
+            total_duration=total_duration,
+            album_art=None,
+            codecs=codecs,
+            tracks=album_tracks,
+        )))
+
+    # Sort by year (newest first), then by name
+    decorated.sort(key=itemgetter(0), reverse=True)
+    return [album for _, album in decorated]
+
+
+def format_artist_stats(albums: list[AlbumInfo]) -> str:
+    """Format the track/album/duration/codec summary line for an artist."""
+    total_tracks = 0
+    total_duration = 0.0
+    all_codecs = set()
+    for a in albums:
+        total_tracks += a.track_count
+        total_duration += a.total_duration
+        all_codecs.update(a.codecs)
+
+    hours = int(total_duration // 3600)
+    minutes = int((total_duration % 3600) // 60)
+    duration_text = f"{hours}h {minutes}m" if hours > 0 else f"{minutes}m"
+
+    codecs_text = ", ".join(sorted(all_codecs)) if all_codecs else ""
+    stats_parts = [
+        f"{total_tracks} tracks",
+        f"{len(albums)} albums",
+        duration_text,
+    ]
+    if codecs_text:
+        stats_parts.append(codecs_text)
+
+    return "  •  ".join(stats_parts)
+
+
+def load_album_art(album: AlbumInfo) -> None:
+    """Fill in album art from the first of the album's tracks that has it."""
+    for t in album.tracks:
+        t.load_album_art()
+        if t.album_art:
+            album.album_art = t.album_art
+            break
+    album.art_loaded = True
+
+
+class ArtistDataWorker(QObject):
+    """Worker that builds album data and reads album art off the UI thread."""
+
+    albums_ready = pyqtSignal(str, list)  # artist, list[AlbumInfo]
+    art_ready = pyqtSignal(object)  # AlbumInfo
+
+    @pyqtSlot(str, dict)
+    def build(self, artist: str, albums_dict: dict):
+        self.albums_ready.emit(artist, build_albums(albums_dict))
+
+    @pyqtSlot(list)
+    def load_art(self, albums: list):
+        for album in albums:
+            if not album.art_loaded:
+                load_album_art(album)
+            self.art_ready.emit(album)
+
+
+class FlowLayout(QLayout):
+    """Layout that places items left to right, wrapping into rows (hidden items are skipped)."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._items: list[QLayoutItem] = []
+        self._columns = 1
+
+    def addItem(self, item: QLayoutItem):
+        self._items.append(item)
+
+    def count(self) -> int:
+        return len(self._items)
+
+    def itemAt(self, index: int) -> QLayoutItem | None:
+        return self._items[index] if 0 <= index < len(self._items) else None
+
+    def takeAt(self, index: int) -> QLayoutItem | None:
+        return self._items.pop(index) if 0 <= index < len(self._items) else None
+
+    def expandingDirections(self) -> Qt.Orientation:
+        return Qt.Orientation(0)
+
+    def hasHeightForWidth(self) -> bool:
+        return True
+
+    def heightForWidth(self, width: int) -> int:
+        return self._do_layout(QRect(0, 0, width, 0), test_only=True)
+
+    def setGeometry(self, rect: QRect):
+        super().setGeometry(rect)
+        self._do_layout(rect, test_only=False)
+
+    def sizeHint(self) -> QSize:
+        return self.minimumSize()
+
+    def minimumSize(self) -> QSize:
+        size = QSize()
+        for item in self._items:
+            size = size.expandedTo(item.minimumSize())
+        margins = self.contentsMargins()
+        return size + QSize(margins.left() + margins.right(), margins.top() + margins.bottom())
+
+    def columns(self) -> int:
+        """Get the number of items in a full row at the last laid-out width."""
+        return self._columns
+
+    def _do_layout(self, rect: QRect, test_only: bool) -> int:
+        """Position items within rect (or just measure); returns the height used."""
+        area = rect.marginsRemoved(self.contentsMargins())
+        spacing = self.spacing()
+        x, y = area.x(), area.y()
+        row_height = 0
+        columns = col = 0
+
+        for item in self._items:
+            if item.isEmpty():
+                continue
+            hint = item.sizeHint()
+            if col and x + hint.width() > area.right() + 1:
+                # Wrap to the next row
+                x = area.x()
+                y += row_height + spacing
+                row_height = col = 0
+            if not test_only:
+                item.setGeometry(QRect(x, y, hint.width(), hint.height()))
+            x += hint.width() + spacing
+            row_height = max(row_height, hint.height())
+            col += 1
+            columns = max(columns, col)
+
+        if not test_only:
+            self._columns = max(1, columns)
+        margins = self.contentsMargins()
+        return y + row_height - rect.y() + margins.bottom()
 
 
 class AlbumCard(QFrame):
     """Clickable album card with art and info."""
 
-    clicked = pyqtSignal(str)  # Emits album name
+    clicked = pyqtSignal(object)  # Emits the card's AlbumInfo
 
     def __init__(self, album: AlbumInfo, parent=None):
         super().__init__(parent)
@@ -46,142 +398,141 @@ class AlbumCard(QFrame):
         self._setup_ui()
 
     def _setup_ui(self):
+        self.setObjectName("albumCard")
         self.setFixedSize(140, 190)
         self.setCursor(Qt.CursorShape.PointingHandCursor)
-        self._update_style()
         self._create_content()
 
-    def _update_style(self):
-        if self._selected:
-            self.setStyleSheet(f"""
-                QFrame {{
-                    background-color: {BG_TERTIARY};
-                    border: 2px solid {ACCENT};
-                }}
-            """)
-        else:
-            self.setStyleSheet(f"""
-                QFrame {{
-                    background-color: {BG_SECONDARY};
-                    border: 1px solid {BORDER};
-                }}
-                QFrame:hover {{
-                    border-color: {ACCENT};
-                    background-color: {BG_TERTIARY};
-                }}
-            """)
-
     def set_selected(self, selected: bool):
         """Set selection state for keyboard navigation."""
         self._selected = selected
-        self._update_style()
+        self.update()
+
+    def paintEvent(self, event):
+        # Selection is painted directly so arrow-key navigation never restyles the card
+        if not self._selected:
+            super().paintEvent(event)
+            return
+        painter = QPainter(self)
+        painter.fillRect(self.rect(), QColor(BG_TERTIARY))
+        painter.setPen(QPen(QColor(ACCENT), 2))
+        painter.drawRect(self.rect().adjusted(1, 1, -1, -1))
 
     def _create_content(self):
         layout = QVBoxLayout(self)
         layout.setContentsMargins(8, 8, 8, 8)
         layout.setSpacing(6)
 
-        # Album art
-        art_label = QLabel()
-        art_label.setFixedSize(124, 124)
-        art_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        art_label.setStyleSheet(f"""
-            QLabel {{
-                background-color: {BG_PRIMARY};
-                border: 1px solid {BORDER};
-            }}
-        """)
-
-        if self._album.album_art:
-            pixmap = QPixmap()
-            pixmap.loadFromData(self._album.album_art)
-            scaled = pixmap.scaled(
-                124, 124,
-                Qt.AspectRatioMode.KeepAspectRatio,
-                Qt.TransformationMode.SmoothTransformation
-            )
-            art_label.setPixmap(scaled)
-        else:
-            art_label.setText("No Art")
-            art_label.setStyleSheet(art_label.styleSheet() + f"""
-                color: {TEXT_DIM};
-                font-size: 10px;
-            """)
-
-        layout.addWidget(art_label)
+        # Album art ("No Art" text styling is harmless when a pixmap is shown)
+        self._art_label = QLabel()
+        self._art_label.setObjectName("albumCardArt")
+        self._art_label.setFixedSize(124, 124)
+        self._art_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        layout.addWidget(self._art_label)
 
         # Album name (truncated)
-        name_label = QLabel(self._album.name)
-        name_label.setStyleSheet(f"""
-            color: {TEXT_NORMAL};
-            font-size: 11px;
-            font-weight: bold;
-            background: transparent;
-            border: none;
-        """)
-        name_label.setWordWrap(False)
-        name_label.setMaximumWidth(124)
-        # Elide text if too long
-        metrics = name_label.fontMetrics()
-        elided = metrics.elidedText(self._album.name, Qt.TextElideMode.ElideRight, 120)
-        name_label.setText(elided)
-        name_label.setToolTip(self._album.name)
-        layout.addWidget(name_label)
+        self._name_label = QLabel()
+        self._name_label.setObjectName("albumCardName")
+        self._name_label.setWordWrap(False)
+        self._name_label.setMaximumWidth(124)
+        layout.addWidget(self._name_label)
 
         # Year and track count
+        self._info_label = QLabel()
+        self._info_label.setObjectName("albumCardInfo")
+        layout.addWidget(self._info_label)
+
+        self._show_album()
+
+    @property
+    def album(self) -> AlbumInfo:
+        """Get the album shown on this card."""
+        return self._album
+
+    def rebind(self, album: AlbumInfo):
+        """Show a different album, reusing this card's widgets."""
+        self._album = album
+        if self._selected:
+            self.set_selected(False)
+        self._show_album()
+
+    def show_art(self):
+        """Show the album's art, or a placeholder if it has none (or isn't loaded yet)."""
+        if self._album.album_art:
+            self._art_label.setPixmap(_scaled_art(self._album.album_art))
+        else:
+            self._art_label.setText("No Art" if self._album.art_loaded else "")
+
+    def _show_album(self):
+        """Fill the labels from the current album."""
+        self.show_art()
+
+        # Elide text if too long (polish first so the stylesheet font is applied)
+        name = self._album.name
+        elided = _elided_names.get(name)
+        if elided is None:
+            self._name_label.ensurePolished()
+            metrics = self._name_label.fontMetrics()
+            elided = _elided_names[name] = metrics.elidedText(name, Qt.TextElideMode.ElideRight, 120)
+        self._name_label.setText(elided)
+        self._name_label.setToolTip(name)
+
         info_text = f"{self._album.year}" if self._album.year else ""
         if self._album.track_count:
             if info_text:
                 info_text += f"  •  {self._album.track_count} tracks"
             else:
                 info_text = f"{self._album.track_count} tracks"
-
-        info_label = QLabel(info_text)
-        info_label.setStyleSheet(f"""
-            color: {TEXT_DIM};
-            font-size: 10px;
-            background: transparent;
-            border: none;
-        """)
-        layout.addWidget(info_label)
+        self._info_label.setText(info_text)
 
     def mousePressEvent(self, event):
         if event.button() == Qt.MouseButton.LeftButton:
-            self.clicked.emit(self._album.name)
+            self.clicked.emit(self._album)
         super().mousePressEvent(event)
 
 
 class ArtistOverlay(QDialog):
     """Artist dossier overlay showing artist info and album grid."""
 
-    album_selected = pyqtSignal(str, str)  # artist, album
+    album_selected = pyqtSignal(str, object)  # artist, AlbumInfo
     play_all_requested = pyqtSignal(str)  # artist
+    _build_requested = pyqtSignal(str, dict)  # artist, album -> tracks (to the worker thread)
+    _art_requested = pyqtSignal(list)  # AlbumInfos whose art to load (to the worker thread)
 
     def __init__(self, parent=None):
         super().__init__(parent)
         self._tracks: list[Track] = []
+        self._artist_index: dict[str, dict[str, list[Track]]] = {}  # artist (casefolded) -> album -> tracks
+        self._indexed_len: int = -1
+        self._last_artist: str | None = None  # casefolded artist the album grid was last built for
+        self._stats_cache: dict[str, str] = {}  # casefolded artist -> stats line
         self._artist: str = ""
         self._albums: list[AlbumInfo] = []
         self._album_cards: list[AlbumCard] = []
+        self._card_pool: list[AlbumCard] = []  # cards reused across opens, in grid order
         self._selected_index: int = 0
-        self._cols: int = 4
         self._setup_ui()
 
+        # Album data is built on a worker thread; the dialog opens immediately
+        self._worker_thread = QThread(self)
+        self._worker = ArtistDataWorker()
+        self._worker.moveToThread(self._worker_thread)
+        self._build_requested.connect(self._worker.build)
+        self._worker.albums_ready.connect(self._on_albums_ready)
+        self._art_requested.connect(self._worker.load_art)
+        self._worker.art_ready.connect(self._on_art_ready)
+        self._worker_thread.start()
+
     def _setup_ui(self):
         self.setWindowFlags(Qt.WindowType.FramelessWindowHint | Qt.WindowType.Dialog)
         self.setModal(True)
         self.setFixedSize(700, 500)
+        self.setStyleSheet(OVERLAY_STYLESHEET)
 
         # Main container
         container = QFrame(self)
         container.setObjectName("artistContainer")
         container.setFixedSize(700, 500)
-        container.setStyleSheet(f"""
-            QFrame#artistContainer {{
-                background-color: {BG_PRIMARY};
-                border: 1px solid {ACCENT};
-            }}
-        """)
 
         layout = QVBoxLayout(container)
         layout.setContentsMargins(0, 0, 0, 0)
@@ -190,27 +541,13 @@ class ArtistOverlay(QDialog):
         # Header
         header = QFrame()
         header.setFixedHeight(32)
-        header.setStyleSheet(f"""
-            QFrame {{
-                background-color: {BG_PRIMARY};
-                border: none;
-                border-bottom: 1px solid {BORDER};
-            }}
-            QLabel {{
-                border: none;
-            }}
-        """)
+        header.setObjectName("artistHeader")
         header_layout = QHBoxLayout(header)
         header_layout.setContentsMargins(12, 0, 12, 0)
 
         title = QLabel("ARTIST DOSSIER")
-        title.setStyleSheet(f"""
-            color: {ACCENT};
-            font-size: 11px;
-            font-weight: bold;
-            letter-spacing: 2px;
-            border: none;
-        """)
+        title.setObjectName("artistTitle")
+        title.setFont(_label_font(11, bold=True, spacing=2))
         header_layout.addWidget(title)
         header_layout.addStretch()
 
@@ -218,34 +555,19 @@ class ArtistOverlay(QDialog):
 
         # Artist info section
         info_section = QFrame()
-        info_section.setStyleSheet(f"""
-            QFrame {{
-                background-color: {BG_SECONDARY};
-                border: none;
-                border-bottom: 1px solid {BORDER};
-            }}
-            QLabel {{
-                border: none;
-                background: transparent;
-            }}
-        """)
+        info_section.setObjectName("artistInfo")
         info_layout = QVBoxLayout(info_section)
         info_layout.setContentsMargins(16, 16, 16, 16)
         info_layout.setSpacing(8)
 
         self._artist_label = QLabel("")
-        self._artist_label.setStyleSheet(f"""
-            color: {TEXT_NORMAL};
-            font-size: 20px;
-            font-weight: bold;
-        """)
+        self._artist_label.setObjectName("artistName")
+        self._artist_label.setFont(_label_font(20, bold=True))
         info_layout.addWidget(self._artist_label)
 
         self._stats_label = QLabel("")
-        self._stats_label.setStyleSheet(f"""
-            color: {TEXT_MUTED};
-            font-size: 12px;
-        """)
+        self._stats_label.setObjectName("artistStats")
+        self._stats_label.setFont(_label_font(12))
         info_layout.addWidget(self._stats_label)
 
         layout.addWidget(info_section)
@@ -253,24 +575,13 @@ class ArtistOverlay(QDialog):
         # Albums section header
         albums_header = QFrame()
         albums_header.setFixedHeight(28)
-        albums_header.setStyleSheet(f"""
-            QFrame {{
-                background-color: {BG_PRIMARY};
-                border: none;
-            }}
-            QLabel {{
-                border: none;
-            }}
-        """)
+        albums_header.setObjectName("albumsHeader")
         albums_header_layout = QHBoxLayout(albums_header)
         albums_header_layout.setContentsMargins(16, 0, 16, 0)
 
         albums_title = QLabel("DISCOGRAPHY")
-        albums_title.setStyleSheet(f"""
-            color: {TEXT_DIM};
-            font-size: 10px;
-            letter-spacing: 1px;
-        """)
+        albums_title.setObjectName("albumsTitle")
+        albums_title.setFont(_label_font(10, spacing=1))
         albums_header_layout.addWidget(albums_title)
         albums_header_layout.addStretch()
 
@@ -281,91 +592,42 @@ class ArtistOverlay(QDialog):
         self._scroll.setWidgetResizable(True)
         self._scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
         self._scroll.setFocusPolicy(Qt.FocusPolicy.NoFocus)  # Prevent scroll area from stealing focus
-        self._scroll.setStyleSheet(f"""
-            QScrollArea {{
-                background-color: {BG_PRIMARY};
-                border: none;
-            }}
-            QScrollBar:vertical {{
-                background-color: {BG_PRIMARY};
-                width: 8px;
-                border: none;
-            }}
-            QScrollBar::handle:vertical {{
-                background-color: {BORDER};
-                border-radius: 4px;
-                min-height: 20px;
-            }}
-            QScrollBar::handle:vertical:hover {{
-                background-color: {TEXT_DIM};
-            }}
-            QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {{
-                height: 0px;
-            }}
-        """)
+        self._scroll.setObjectName("albumScroll")
 
         self._albums_container = QWidget()
-        self._albums_container.setStyleSheet(f"background-color: {BG_PRIMARY};")
-        self._albums_layout = QGridLayout(self._albums_container)
+        self._albums_container.setObjectName("albumsContainer")
+        self._albums_layout = FlowLayout(self._albums_container)
         self._albums_layout.setContentsMargins(16, 8, 16, 16)
         self._albums_layout.setSpacing(12)
-        self._albums_layout.setAlignment(Qt.AlignmentFlag.AlignTop | Qt.AlignmentFlag.AlignLeft)
 
         self._scroll.setWidget(self._albums_container)
+        self._scroll.verticalScrollBar().valueChanged.connect(self._request_visible_art)
         layout.addWidget(self._scroll, 1)
 
         # Footer with buttons
         footer = QFrame()
         footer.setFixedHeight(48)
-        footer.setStyleSheet(f"""
-            QFrame {{
-                background-color: {BG_PRIMARY};
-                border: none;
-                border-top: 1px solid {BORDER};
-            }}
-        """)
+        footer.setObjectName("artistFooter")
         footer_layout = QHBoxLayout(footer)
         footer_layout.setContentsMargins(16, 8, 16, 8)
         footer_layout.setSpacing(12)
 
         play_all_btn = QPushButton("Play All")
         play_all_btn.setFocusPolicy(Qt.FocusPolicy.NoFocus)
-        play_all_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {ACCENT_DIM};
-                color: {TEXT_NORMAL};
-                border: 1px solid {ACCENT};
-                padding: 6px 16px;
-                font-size: 12px;
-            }}
-            QPushButton:hover {{
-                background-color: {ACCENT};
-            }}
-        """)
+        play_all_btn.setObjectName("playAllButton")
         play_all_btn.clicked.connect(self._on_play_all)
         footer_layout.addWidget(play_all_btn)
 
         footer_layout.addStretch()
 
         hint = QLabel("Arrows: navigate  |  Enter: select  |  p: play all  |  Esc: close")
-        hint.setStyleSheet(f"color: {TEXT_DIM}; font-size: 10px;")
+        hint.setObjectName("footerHint")
+        hint.setFont(_label_font(10))
         footer_layout.addWidget(hint)
 
         close_btn = QPushButton("Close")
         close_btn.setFocusPolicy(Qt.FocusPolicy.NoFocus)
-        close_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: transparent;
-                color: {TEXT_MUTED};
-                border: 1px solid {BORDER};
-                padding: 6px 16px;
-                font-size: 12px;
-            }}
-            QPushButton:hover {{
-                color: {TEXT_NORMAL};
-                border-color: {TEXT_MUTED};
-            }}
-        """)
+        close_btn.setObjectName("closeButton")
         close_btn.clicked.connect(self.reject)
         footer_layout.addWidget(close_btn)
 
@@ -378,13 +640,26 @@ class ArtistOverlay(QDialog):
 
     def set_tracks(self, tracks: list[Track]):
         """Set the library tracks for lookups."""
+        if tracks is self._tracks and len(tracks) == self._indexed_len:
+            return
         self._tracks = tracks
+        self._artist_index = build_artist_index(tracks)
+        self._indexed_len = len(tracks)
+        self._last_artist = None
+        self._stats_cache.clear()
 
     def show_artist(self, artist: str):
         """Show the overlay for a specific artist."""
         self._artist = artist
-        self._build_artist_data()
-        self._populate_ui()
+        if artist.casefold() == self._last_artist:
+            # Same artist and library as last time: the grid is still current
+            self._artist_label.setText(artist)
+        else:
+            self._last_artist = None
+            self._albums = []
+            self._populate_ui()
+            self._stats_label.setText("Loading...")
+            self._build_requested.emit(artist, self._artist_index.get(artist.casefold(), {}))
 
         if self.parent():
             parent_geo = self.parent().geometry()
@@ -395,100 +670,82 @@ class ArtistOverlay(QDialog):
         self.setFocus()
         self.exec()
 
-    def _build_artist_data(self):
-        """Build album data from tracks."""
-        # Filter tracks by artist
-        artist_tracks = [t for t in self._tracks if t.artist.lower() == self._artist.lower()]
-
-        # Group by album
-        albums_dict: dict[str, list[Track]] = {}
-        for track in artist_tracks:
-            album_name = track.album if track.album and track.album != "Unknown" else "(Singles)"
-            if album_name not in albums_dict:
-                albums_dict[album_name] = []
-            albums_dict[album_name].append(track)
-
-        # Build AlbumInfo objects
-        self._albums = []
-        for album_name, tracks in albums_dict.items():
-            # Get album art from first track that has it
-            album_art = None
-            for t in tracks:
-                t.load_album_art()
-                if t.album_art:
-                    album_art = t.album_art
-                    break
-
-            # Get year (use most common or first non-empty)
-            years = [t.year for t in tracks if t.year]
-            year = years[0] if years else ""
-
-            # Get codecs
-            codecs = {t.codec for t in tracks if t.codec and t.codec != "Unknown"}
-
-            self._albums.append(AlbumInfo(
-                name=album_name,
-                year=year,
-                track_count=len(tracks),
-                total_duration=sum(t.duration for t in tracks),
-                album_art=album_art,
-                codecs=codecs,
-            ))
-
-        # Sort by year (newest first), then by name
-        self._albums.sort(key=lambda a: (a.year or "0000", a.name), reverse=True)
+    def _on_albums_ready(self, artist: str, albums: list[AlbumInfo]):
+        """Populate the overlay once the worker has built the album data."""
+        if artist != self._artist:
+            return  # Superseded by a newer request
+        self._albums = albums
+        self._last_artist = artist.casefold()
+        self._populate_ui()
+        self._request_visible_art()
+
+    def _request_visible_art(self):
+        """Queue art loads for albums whose cards are in the visible part of the grid."""
+        viewport = self._scroll.viewport()
+        visible = QRect(0, self._scroll.verticalScrollBar().value(), viewport.width(), viewport.height())
+        pending = []
+        for card in self._album_cards:
+            album = card.album
+            if not album.art_requested and card.geometry().intersects(visible):
+                album.art_requested = True
+                pending.append(album)
+        if pending:
+            self._art_requested.emit(pending)
+
+    def _on_art_ready(self, album: AlbumInfo):
+        """Show newly loaded art on the card bound to that album, if any."""
+        for card in self._album_cards:
+            if card.album is album:
+                card.show_art()
+                break
+
+    def shutdown(self):
+        """Stop the worker thread."""
+        self._worker_thread.quit()
+        self._worker_thread.wait()
 
     def _populate_ui(self):
         """Populate the UI with artist data."""
-        # Clear existing album cards
-        while self._albums_layout.count():
-            item = self._albums_layout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
-
         # Artist name
         self._artist_label.setText(self._artist)
 
-        # Stats
-        total_tracks = sum(a.track_count for a in self._albums)
-        total_duration = sum(a.total_duration for a in self._albums)
-        all_codecs = set()
-        for a in self._albums:
-            all_codecs.update(a.codecs)
-
-        hours = int(total_duration // 3600)
-        minutes = int((total_duration % 3600) // 60)
-        duration_text = f"{hours}h {minutes}m" if hours > 0 else f"{minutes}m"
-
-        codecs_text = ", ".join(sorted(all_codecs)) if all_codecs else ""
-        stats_parts = [
-            f"{total_tracks} tracks",
-            f"{len(self._albums)} albums",
-            duration_text,
-        ]
-        if codecs_text:
-            stats_parts.append(codecs_text)
-
-        self._stats_label.setText("  •  ".join(stats_parts))
-
-        # Album grid (4 columns)
-        self._album_cards = []
-        self._selected_index = 0
+        # Stats (cached per artist; not while the album list is still loading)
+        key = self._artist.casefold()
+        stats_text = self._stats_cache.get(key) if self._albums else None
+        if stats_text is None:
+            stats_text = format_artist_stats(self._albums)
+            if self._albums:
+                self._stats_cache[key] = stats_text
+        self._stats_label.setText(stats_text)
+
+        # Album grid, rebinding pooled cards and creating only what's missing.
+        # Repaints are held off until every card is in place, then laid out once.
+        self._albums_container.setUpdatesEnabled(False)
+        pool = self._card_pool
         for i, album in enumerate(self._albums):
-            card = AlbumCard(album)
-            card.clicked.connect(self._on_album_clicked)
-            row = i // self._cols
-            col = i % self._cols
-            self._albums_layout.addWidget(card, row, col)
-            self._album_cards.append(card)
+            if i < len(pool):
+                card = pool[i]
+                card.rebind(album)
+            else:
+                card = AlbumCard(album, self._albums_container)
+                card.clicked.connect(self._on_album_clicked)
+                self._albums_layout.addWidget(card)
+                pool.append(card)
+            card.show()
+        for card in pool[len(self._albums):]:
+            card.hide()
+        self._album_cards = pool[:len(self._albums)]
+        self._selected_index = 0
+        self._albums_layout.activate()
+        self._albums_container.setUpdatesEnabled(True)
 
         # Select first album
         if self._album_cards:
             self._album_cards[0].set_selected(True)
 
-    def _on_album_clicked(self, album_name: str):
+    def _on_album_clicked(self, album: AlbumInfo):
         """Handle album card click."""
-        self.album_selected.emit(self._artist, album_name)
+        self.album_selected.emit(self._artist, album)
         self.accept()
 
     def _on_play_all(self):
@@ -501,8 +758,10 @@ class ArtistOverlay(QDialog):
         if not self._album_cards:
             return
 
-        # Clamp index
+        # Clamp index; nothing to do if that lands on the current album
         index = max(0, min(len(self._album_cards) - 1, index))
+        if index == self._selected_index:
+            return
 
         # Deselect old
         if 0 <= self._selected_index < len(self._album_cards):
@@ -525,14 +784,13 @@ class ArtistOverlay(QDialog):
         elif event.key() == Qt.Key.Key_Right:
             self._select_album(self._selected_index + 1)
         elif event.key() == Qt.Key.Key_Up:
-            self._select_album(self._selected_index - self._cols)
+            self._select_album(self._selected_index - self._albums_layout.columns())
         elif event.key() == Qt.Key.Key_Down:
-            self._select_album(self._selected_index + self._cols)
+            self._select_album(self._selected_index + self._albums_layout.columns())
         elif event.key() in (Qt.Key.Key_Return, Qt.Key.Key_Enter):
             # Select current album
             if self._album_cards and 0 <= self._selected_index < len(self._albums):
-                album_name = self._albums[self._selected_index].name
-                self.album_selected.emit(self._artist, album_name)
+                self.album_selected.emit(self._artist, self._albums[self._selected_index])
                 self.accept()
         elif event.key() == Qt.Key.Key_P:
             # Play all
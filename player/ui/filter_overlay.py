@@ -1,15 +1,19 @@
 """Telescope-style filter overlay for filtering tracks."""
 
+import re
 from dataclasses import dataclass
-from PyQt6.QtCore import Qt, pyqtSignal, QTimer, QSize, QRect
-from PyQt6.QtGui import QKeyEvent, QColor, QPainter
+from itertools import islice
+from operator import attrgetter
+from typing import Callable, Sequence
+
+from PyQt6.QtCore import Qt, pyqtSignal, QTimer, QSize, QRect, QPointF, QModelIndex, QStringListModel
+from PyQt6.QtGui import QKeyEvent, QColor, QPainter, QStaticText
 from PyQt6.QtWidgets import (
     QWidget,
     QVBoxLayout,
     QHBoxLayout,
     QLineEdit,
-    QListWidget,
-    QListWidgetItem,
+    QListView,
     QLabel,
     QFrame,
     QDialog,
@@ -28,24 +32,52 @@ from player.theme.lainchan import (
 )
 
 
+def match_text(value: str) -> str:
+    """
+    Lowercase a field value for substring matching.
+
+    Semicolon-separated parts (e.g. genres) are stripped and joined by newlines,
+    so a substring test matches within one part only, as FilterCondition does.
+    """
+    if ";" in value:
+        return "\n".join(part.strip().lower() for part in value.split(";"))
+    return value.lower()
+
+
+# Year range filter values (YYYY-YYYY)
+YEAR_RANGE_RE = re.compile(r"^\d{4}-\d{4}$")
+
+
 @dataclass
 class FilterCondition:
     """Represents a single filter condition."""
     field: str  # artist, album, year, genre, codec
     value: str
 
+    def __post_init__(self):
+        # Resolved once, since matches() runs for every track in the library
+        self.field_getter = attrgetter(self.field)
+        self.search_value = self.value.lower()
+        self._year_bounds: tuple[int, int] | None = None
+        if self.field == "year" and YEAR_RANGE_RE.match(self.value):
+            start, end = self.value.split("-")
+            self._year_bounds = (int(start), int(end))
+
     def matches(self, track: Track) -> bool:
         """Check if track matches this condition."""
         # Handle favorite field (boolean)
         if self.field == "favorite":
             return track.favorite
 
-        field_value = getattr(track, self.field, "")
-        search_value = self.value.lower()
+        try:
+            field_value = self.field_getter(track)
+        except AttributeError:
+            field_value = ""
+        search_value = self.search_value
 
         # Handle year ranges (e.g., 1980-1990)
-        if self.field == "year" and self._is_year_range():
-            return self._matches_year_range(field_value)
+        if self._year_bounds is not None:
+            return self.matches_year_range(field_value)
 
         # Handle semicolon-separated values (e.g., genre field)
         if ";" in field_value:
@@ -53,21 +85,18 @@ class FilterCondition:
 
         return search_value in field_value.lower()
 
-    def _is_year_range(self) -> bool:
+    def is_year_range(self) -> bool:
         """Check if value is a year range pattern (YYYY-YYYY)."""
-        import re
-        return bool(re.match(r"^\d{4}-\d{4}$", self.value))
+        return self._year_bounds is not None
 
-    def _matches_year_range(self, track_year: str) -> bool:
+    def matches_year_range(self, track_year: str) -> bool:
         """Check if track year falls within the range."""
+        start_year, end_year = self._year_bounds
         try:
-            start, end = self.value.split("-")
-            start_year = int(start)
-            end_year = int(end)
             track_year_int = int(track_year[:4]) if track_year else 0
-            return start_year <= track_year_int <= end_year
-        except (ValueError, IndexError):
+        except ValueError:
             return False
+        return start_year <= track_year_int <= end_year
 
     def __str__(self) -> str:
         return f"{self.field}:{self.value}"
@@ -86,6 +115,134 @@ class Filter:
         return " | ".join(str(c) for c in self.conditions)
 
 
+# Filter chip styles, formatted once and shared by every chip
+CHIP_STYLE = f"""
+    QFrame#filterChip {{
+        background-color: {ACCENT_DIM};
+        border: 1px solid {ACCENT};
+        border-radius: 2px;
+        padding: 2px;
+    }}
+"""
+CHIP_SEPARATOR_STYLE = f"color: {TEXT_MUTED}; font-size: 12px; border: none; background: transparent;"
+CHIP_LABEL_STYLE = f"color: {TEXT_NORMAL}; font-size: 12px; border: none; background: transparent;"
+CHIP_REMOVE_STYLE = f"""
+    QPushButton {{
+        background-color: transparent;
+        color: {TEXT_MUTED};
+        border: none;
+        font-size: 14px;
+        font-weight: bold;
+    }}
+    QPushButton:hover {{
+        color: {TEXT_NORMAL};
+    }}
+"""
+
+
+# Overlay styles, formatted once at import
+CONTAINER_STYLE = f"""
+    QFrame#filterContainer {{
+        background-color: {BG_PRIMARY};
+        border: 1px solid {ACCENT};
+    }}
+"""
+HEADER_STYLE = f"""
+    QFrame {{
+        background-color: {BG_PRIMARY};
+        border: none;
+        border-bottom: 1px solid {BORDER};
+    }}
+    QLabel {{
+        border: none;
+    }}
+"""
+TITLE_STYLE = f"""
+    color: {ACCENT};
+    font-size: 11px;
+    font-weight: bold;
+    letter-spacing: 2px;
+    border: none;
+"""
+MATCH_LABEL_STYLE = f"color: {TEXT_DIM}; font-size: 11px; border: none;"
+SECTION_STYLE = f"""
+    QFrame {{
+        background-color: {BG_SECONDARY};
+        border: none;
+        border-bottom: 1px solid {BORDER};
+    }}
+    QLabel {{
+        border: none;
+    }}
+"""
+SECTION_LABEL_STYLE = f"color: {TEXT_DIM}; font-size: 10px; letter-spacing: 1px;"
+CHIPS_CONTAINER_STYLE = f"background-color: {BG_SECONDARY};"
+NO_FILTERS_STYLE = f"color: {TEXT_DIM}; font-size: 12px; font-style: italic; background: transparent;"
+PROMPT_STYLE = f"color: {ACCENT}; font-weight: bold; border: none;"
+INPUT_STYLE = f"""
+    QLineEdit {{
+        background-color: transparent;
+        border: none;
+        color: {TEXT_NORMAL};
+        font-size: 14px;
+        padding: 4px;
+    }}
+"""
+SUGGESTIONS_STYLE = f"""
+    QListView {{
+        background-color: {BG_SECONDARY};
+        border: none;
+        outline: none;
+    }}
+    QListView::item {{
+        border: none;
+    }}
+"""
+BUTTON_SECTION_STYLE = f"""
+    QFrame {{
+        background-color: {BG_PRIMARY};
+        border: none;
+        border-top: 1px solid {BORDER};
+    }}
+"""
+BUTTON_PRIMARY_STYLE = f"""
+    QPushButton {{
+        background-color: {ACCENT_DIM};
+        color: {TEXT_NORMAL};
+        border: 1px solid {ACCENT};
+        padding: 6px 16px;
+        font-size: 12px;
+    }}
+    QPushButton:hover {{
+        background-color: {ACCENT};
+    }}
+"""
+BUTTON_SECONDARY_STYLE = f"""
+    QPushButton {{
+        background-color: transparent;
+        color: {TEXT_MUTED};
+        border: 1px solid {BORDER};
+        padding: 6px 16px;
+        font-size: 12px;
+    }}
+    QPushButton:hover {{
+        color: {TEXT_NORMAL};
+        border-color: {TEXT_MUTED};
+    }}
+"""
+FOOTER_STYLE = f"""
+    QFrame#filterFooter {{
+        background-color: {BG_PRIMARY};
+        border: none;
+        border-top: 1px solid {BORDER};
+    }}
+    QLabel {{
+        border: none;
+    }}
+"""
+HINT_STYLE = f"color: {TEXT_DIM}; font-size: 10px;"
+
+
 class FilterChip(QFrame):
     """A removable filter chip widget."""
 
@@ -94,51 +251,50 @@ class FilterChip(QFrame):
     def __init__(self, filter_: Filter, parent=None):
         super().__init__(parent)
         self._filter = filter_
+        self._cond_labels: list[QLabel] = []
+        self._sep_labels: list[QLabel] = []  # separator before each condition after the first
         self._setup_ui()
+        self.set_filter(filter_)
 
     def _setup_ui(self):
         self.setObjectName("filterChip")
-        self.setStyleSheet(f"""
-            QFrame#filterChip {{
-                background-color: {ACCENT_DIM};
-                border: 1px solid {ACCENT};
-                border-radius: 2px;
-                padding: 2px;
-            }}
-        """)
-
-        layout = QHBoxLayout(self)
-        layout.setContentsMargins(8, 4, 4, 4)
-        layout.setSpacing(4)
-
-        # Build label with styled OR separators
-        for i, condition in enumerate(self._filter.conditions):
-            if i > 0:
-                sep = QLabel("|")
-                sep.setStyleSheet(f"color: {TEXT_MUTED}; font-size: 12px; border: none; background: transparent;")
-                layout.addWidget(sep)
+        self.setStyleSheet(CHIP_STYLE)
 
-            cond_label = QLabel(str(condition))
-            cond_label.setStyleSheet(f"color: {TEXT_NORMAL}; font-size: 12px; border: none; background: transparent;")
-            layout.addWidget(cond_label)
+        self._layout = QHBoxLayout(self)
+        self._layout.setContentsMargins(8, 4, 4, 4)
+        self._layout.setSpacing(4)
 
         remove_btn = QPushButton("×")
         remove_btn.setFixedSize(16, 16)
         remove_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        remove_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: transparent;
-                color: {TEXT_MUTED};
-                border: none;
-                font-size: 14px;
-                font-weight: bold;
-            }}
-            QPushButton:hover {{
-                color: {TEXT_NORMAL};
-            }}
-        """)
+        remove_btn.setStyleSheet(CHIP_REMOVE_STYLE)
         remove_btn.clicked.connect(lambda: self.remove_clicked.emit(self._filter))
-        layout.addWidget(remove_btn)
+        self._layout.addWidget(remove_btn)
+
+    def set_filter(self, filter_: Filter):
+        """Show a different filter, reusing the existing labels."""
+        self._filter = filter_
+        conditions = filter_.conditions
+
+        # Add labels (with styled OR separators) until there is one per condition
+        while len(self._cond_labels) < len(conditions):
+            if self._cond_labels:
+                sep = QLabel("|")
+                sep.setStyleSheet(CHIP_SEPARATOR_STYLE)
+                self._layout.insertWidget(self._layout.count() - 1, sep)
+                self._sep_labels.append(sep)
+            cond_label = QLabel()
+            cond_label.setStyleSheet(CHIP_LABEL_STYLE)
+            self._layout.insertWidget(self._layout.count() - 1, cond_label)
+            self._cond_labels.append(cond_label)
+
+        for i, cond_label in enumerate(self._cond_labels):
+            shown = i < len(conditions)
+            if shown:
+                cond_label.setText(str(conditions[i]))
+            cond_label.setVisible(shown)
+            if i > 0:
+                self._sep_labels[i - 1].setVisible(shown)
 
     @property
     def filter(self) -> Filter:
@@ -148,34 +304,48 @@ class FilterChip(QFrame):
 class SuggestionDelegate(QStyledItemDelegate):
     """Custom delegate to render filter suggestions."""
 
+    # Cached text layouts; suggestions repeat across keystrokes
+    STATIC_TEXT_LIMIT = 256
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._bg_tertiary = QColor(BG_TERTIARY)
+        self._accent = QColor(ACCENT)
+        self._text_normal = QColor(TEXT_NORMAL)
+        self._static_texts: dict[str, QStaticText] = {}
+
+    def _static_text(self, text: str) -> QStaticText:
+        static = self._static_texts.get(text)
+        if static is None:
+            if len(self._static_texts) >= self.STATIC_TEXT_LIMIT:
+                self._static_texts.clear()
+            static = QStaticText(text)
+            static.setTextFormat(Qt.TextFormat.PlainText)
+            self._static_texts[text] = static
+        return static
+
     def paint(self, painter: QPainter, option: QStyleOptionViewItem, index):
         painter.save()
+        rect = option.rect
 
         # Background
         if option.state & QStyle.StateFlag.State_Selected:
-            painter.fillRect(option.rect, QColor(BG_TERTIARY))
-            painter.setPen(QColor(ACCENT))
-            painter.drawLine(
-                option.rect.left(), option.rect.top(),
-                option.rect.left(), option.rect.bottom()
-            )
-            painter.drawLine(
-                option.rect.left() + 1, option.rect.top(),
-                option.rect.left() + 1, option.rect.bottom()
-            )
+            painter.fillRect(rect, self._bg_tertiary)
+            painter.setPen(self._accent)
+            painter.drawLine(rect.left(), rect.top(), rect.left(), rect.bottom())
+            painter.drawLine(rect.left() + 1, rect.top(), rect.left() + 1, rect.bottom())
         elif option.state & QStyle.StateFlag.State_MouseOver:
-            painter.fillRect(option.rect, QColor(BG_TERTIARY))
+            painter.fillRect(rect, self._bg_tertiary)
 
         text = index.data(Qt.ItemDataRole.DisplayRole)
         if text:
-            painter.setPen(QColor(TEXT_NORMAL))
-            text_rect = QRect(
-                option.rect.left() + 12,
-                option.rect.top(),
-                option.rect.width() - 24,
-                option.rect.height()
-            )
-            painter.drawText(text_rect, Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter, text)
+            painter.setPen(self._text_normal)
+            text_rect = QRect(rect.left() + 12, rect.top(), rect.width() - 24, rect.height())
+            static = self._static_text(text)
+            static.prepare(painter.transform(), painter.font())
+            y = text_rect.top() + (text_rect.height() - static.size().height()) / 2
+            painter.setClipRect(text_rect)
+            painter.drawStaticText(QPointF(text_rect.left(), y), static)
 
         painter.restore()
 
@@ -194,12 +364,23 @@ class FilterOverlay(QDialog):
     def __init__(self, parent=None):
         super().__init__(parent)
         self._tracks: list[Track] = []
+        self._columns: dict[str, list[str]] = {}  # field -> match_text() per track, built on demand
+        self._columns_len: int = -1
+        self._match_stack: list[tuple[Filter, list[int]]] = []  # (filter, indices matching it and all before it)
+        self._unique_values: dict[str, tuple[list[str], list[str]]] = {}  # field -> (sorted values, lowercased)
         self._filters: list[Filter] = []
+        self._chip_pool: list[FilterChip] = []  # chips reused across edits, in layout order
         self._debounce_timer = QTimer()
         self._debounce_timer.setSingleShot(True)
         self._debounce_timer.setInterval(100)
         self._debounce_timer.timeout.connect(self._update_suggestions)
 
+        # Coalesces match-count scans after rapid filter edits
+        self._match_timer = QTimer()
+        self._match_timer.setSingleShot(True)
+        self._match_timer.setInterval(80)
+        self._match_timer.timeout.connect(self._do_update_match_count)
+
         self._setup_ui()
 
     def _setup_ui(self):
@@ -211,12 +392,7 @@ class FilterOverlay(QDialog):
         container = QFrame(self)
         container.setObjectName("filterContainer")
         container.setFixedSize(600, 450)
-        container.setStyleSheet(f"""
-            QFrame#filterContainer {{
-                background-color: {BG_PRIMARY};
-                border: 1px solid {ACCENT};
-            }}
-        """)
+        container.setStyleSheet(CONTAINER_STYLE)
 
         layout = QVBoxLayout(container)
         layout.setContentsMargins(0, 0, 0, 0)
@@ -225,66 +401,42 @@ class FilterOverlay(QDialog):
         # Header
         header = QFrame()
         header.setFixedHeight(32)
-        header.setStyleSheet(f"""
-            QFrame {{
-                background-color: {BG_PRIMARY};
-                border: none;
-                border-bottom: 1px solid {BORDER};
-            }}
-            QLabel {{
-                border: none;
-            }}
-        """)
+        header.setStyleSheet(HEADER_STYLE)
         header_layout = QHBoxLayout(header)
         header_layout.setContentsMargins(12, 0, 12, 0)
 
         title = QLabel("FILTER")
-        title.setStyleSheet(f"""
-            color: {ACCENT};
-            font-size: 11px;
-            font-weight: bold;
-            letter-spacing: 2px;
-            border: none;
-        """)
+        title.setStyleSheet(TITLE_STYLE)
         header_layout.addWidget(title)
         header_layout.addStretch()
 
         self._match_label = QLabel("")
-        self._match_label.setStyleSheet(f"color: {TEXT_DIM}; font-size: 11px; border: none;")
+        self._match_label.setStyleSheet(MATCH_LABEL_STYLE)
         header_layout.addWidget(self._match_label)
 
         layout.addWidget(header)
 
         # Active filters section
         filters_section = QFrame()
-        filters_section.setStyleSheet(f"""
-            QFrame {{
-                background-color: {BG_SECONDARY};
-                border: none;
-                border-bottom: 1px solid {BORDER};
-            }}
-            QLabel {{
-                border: none;
-            }}
-        """)
+        filters_section.setStyleSheet(SECTION_STYLE)
         filters_layout = QVBoxLayout(filters_section)
         filters_layout.setContentsMargins(12, 8, 12, 8)
         filters_layout.setSpacing(6)
 
         filters_label = QLabel("ACTIVE FILTERS:")
-        filters_label.setStyleSheet(f"color: {TEXT_DIM}; font-size: 10px; letter-spacing: 1px;")
+        filters_label.setStyleSheet(SECTION_LABEL_STYLE)
         filters_layout.addWidget(filters_label)
 
         # Chips container with flow layout
         self._chips_container = QWidget()
-        self._chips_container.setStyleSheet(f"background-color: {BG_SECONDARY};")
+        self._chips_container.setStyleSheet(CHIPS_CONTAINER_STYLE)
         self._chips_layout = QHBoxLayout(self._chips_container)
         self._chips_layout.setContentsMargins(0, 0, 0, 0)
         self._chips_layout.setSpacing(6)
         self._chips_layout.addStretch()
 
         self._no_filters_label = QLabel("No filters active")
-        self._no_filters_label.setStyleSheet(f"color: {TEXT_DIM}; font-size: 12px; font-style: italic; background: transparent;")
+        self._no_filters_label.setStyleSheet(NO_FILTERS_STYLE)
         filters_layout.addWidget(self._no_filters_label)
         filters_layout.addWidget(self._chips_container)
 
@@ -292,42 +444,25 @@ class FilterOverlay(QDialog):
 
         # Input section
         input_section = QFrame()
-        input_section.setStyleSheet(f"""
-            QFrame {{
-                background-color: {BG_SECONDARY};
-                border: none;
-                border-bottom: 1px solid {BORDER};
-            }}
-            QLabel {{
-                border: none;
-            }}
-        """)
+        input_section.setStyleSheet(SECTION_STYLE)
         input_layout = QVBoxLayout(input_section)
         input_layout.setContentsMargins(12, 8, 12, 8)
         input_layout.setSpacing(4)
 
         add_label = QLabel("ADD FILTER:")
-        add_label.setStyleSheet(f"color: {TEXT_DIM}; font-size: 10px; letter-spacing: 1px;")
+        add_label.setStyleSheet(SECTION_LABEL_STYLE)
         input_layout.addWidget(add_label)
 
         input_row = QHBoxLayout()
         input_row.setSpacing(8)
 
         prompt = QLabel(">")
-        prompt.setStyleSheet(f"color: {ACCENT}; font-weight: bold; border: none;")
+        prompt.setStyleSheet(PROMPT_STYLE)
         input_row.addWidget(prompt)
 
         self._input = QLineEdit()
         self._input.setPlaceholderText("artist:name | genre:rock | year:1980-1990")
-        self._input.setStyleSheet(f"""
-            QLineEdit {{
-                background-color: transparent;
-                border: none;
-                color: {TEXT_NORMAL};
-                font-size: 14px;
-                padding: 4px;
-            }}
-        """)
+        self._input.setStyleSheet(INPUT_STYLE)
         self._input.textChanged.connect(self._on_text_changed)
         self._input.installEventFilter(self)
         input_row.addWidget(self._input, 1)
@@ -336,50 +471,38 @@ class FilterOverlay(QDialog):
         layout.addWidget(input_section)
 
         # Suggestions list
-        self._suggestions_list = QListWidget()
+        self._suggestions_model = QStringListModel(self)
+        self._suggestions_list = QListView()
+        self._suggestions_list.setModel(self._suggestions_model)
+        self._suggestions_list.setEditTriggers(QListView.EditTrigger.NoEditTriggers)
         self._suggestions_list.setItemDelegate(SuggestionDelegate(self._suggestions_list))
-        self._suggestions_list.setStyleSheet(f"""
-            QListWidget {{
-                background-color: {BG_SECONDARY};
-                border: none;
-                outline: none;
-            }}
-            QListWidget::item {{
-                border: none;
-            }}
-        """)
-        self._suggestions_list.itemActivated.connect(self._on_suggestion_activated)
-        self._suggestions_list.itemDoubleClicked.connect(self._on_suggestion_activated)
+        self._suggestions_list.setStyleSheet(SUGGESTIONS_STYLE)
+        self._suggestions_list.activated.connect(self._on_suggestion_activated)
+        self._suggestions_list.doubleClicked.connect(self._on_suggestion_activated)
         layout.addWidget(self._suggestions_list, 1)
 
         # Action buttons
         button_section = QFrame()
         button_section.setFixedHeight(48)
-        button_section.setStyleSheet(f"""
-            QFrame {{
-                background-color: {BG_PRIMARY};
-                border: none;
-                border-top: 1px solid {BORDER};
-            }}
-        """)
+        button_section.setStyleSheet(BUTTON_SECTION_STYLE)
         button_layout = QHBoxLayout(button_section)
         button_layout.setContentsMargins(12, 8, 12, 8)
         button_layout.setSpacing(12)
 
         self._apply_btn = QPushButton("Apply")
-        self._apply_btn.setStyleSheet(self._get_button_style(primary=True))
+        self._apply_btn.setStyleSheet(BUTTON_PRIMARY_STYLE)
         self._apply_btn.clicked.connect(self._apply_filters)
         button_layout.addWidget(self._apply_btn)
 
         self._clear_btn = QPushButton("Clear All")
-        self._clear_btn.setStyleSheet(self._get_button_style())
+        self._clear_btn.setStyleSheet(BUTTON_SECONDARY_STYLE)
         self._clear_btn.clicked.connect(self._clear_filters)
         button_layout.addWidget(self._clear_btn)
 
         button_layout.addStretch()
 
         self._save_btn = QPushButton("Save as Playlist...")
-        self._save_btn.setStyleSheet(self._get_button_style())
+        self._save_btn.setStyleSheet(BUTTON_SECONDARY_STYLE)
         self._save_btn.clicked.connect(self._save_as_playlist)
         button_layout.addWidget(self._save_btn)
 
@@ -389,21 +512,12 @@ class FilterOverlay(QDialog):
         footer = QFrame()
         footer.setObjectName("filterFooter")
         footer.setFixedHeight(24)
-        footer.setStyleSheet(f"""
-            QFrame#filterFooter {{
-                background-color: {BG_PRIMARY};
-                border: none;
-                border-top: 1px solid {BORDER};
-            }}
-            QLabel {{
-                border: none;
-            }}
-        """)
+        footer.setStyleSheet(FOOTER_STYLE)
         footer_layout = QHBoxLayout(footer)
         footer_layout.setContentsMargins(12, 0, 12, 0)
 
         hint = QLabel("Enter: add/apply  ·  Tab: complete  ·  | for OR  ·  Backspace: remove  ·  Esc: cancel")
-        hint.setStyleSheet(f"color: {TEXT_DIM}; font-size: 10px;")
+        hint.setStyleSheet(HINT_STYLE)
         footer_layout.addWidget(hint)
 
         layout.addWidget(footer)
@@ -413,37 +527,16 @@ class FilterOverlay(QDialog):
         main_layout.setContentsMargins(0, 0, 0, 0)
         main_layout.addWidget(container)
 
-    def _get_button_style(self, primary: bool = False) -> str:
-        if primary:
-            return f"""
-                QPushButton {{
-                    background-color: {ACCENT_DIM};
-                    color: {TEXT_NORMAL};
-                    border: 1px solid {ACCENT};
-                    padding: 6px 16px;
-                    font-size: 12px;
-                }}
-                QPushButton:hover {{
-                    background-color: {ACCENT};
-                }}
-            """
-        return f"""
-            QPushButton {{
-                background-color: transparent;
-                color: {TEXT_MUTED};
-                border: 1px solid {BORDER};
-                padding: 6px 16px;
-                font-size: 12px;
-            }}
-            QPushButton:hover {{
-                color: {TEXT_NORMAL};
-                border-color: {TEXT_MUTED};
-            }}
-        """
-
     def set_tracks(self, tracks: list[Track]):
         """Set the tracks to filter."""
+        # Favorites may have changed since the last open even if the list hasn't
+        self._match_stack.clear()
+        if tracks is self._tracks and len(tracks) == self._columns_len:
+            return
         self._tracks = tracks
+        self._columns = {}
+        self._columns_len = len(tracks)
+        self._unique_values = {}
 
     def set_filters(self, filters: list[Filter]):
         """Set current filters."""
@@ -465,27 +558,31 @@ class FilterOverlay(QDialog):
 
         self._input.clear()
         self._refresh_chips()
-        self._update_match_count()
+        self._do_update_match_count()
         self._update_suggestions()
         self._input.setFocus()
         self.exec()
 
     def _refresh_chips(self):
         """Refresh the filter chips display."""
-        # Clear existing chips
-        while self._chips_layout.count() > 1:  # Keep the stretch
-            item = self._chips_layout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
-
-        if self._filters:
-            self._no_filters_label.hide()
-            for f in self._filters:
+        # Rebind pooled chips to the filters, creating only what's missing
+        self._chips_container.setUpdatesEnabled(False)
+        pool = self._chip_pool
+        for i, f in enumerate(self._filters):
+            if i < len(pool):
+                chip = pool[i]
+                chip.set_filter(f)
+            else:
                 chip = FilterChip(f)
                 chip.remove_clicked.connect(self._on_remove_filter)
-                self._chips_layout.insertWidget(self._chips_layout.count() - 1, chip)
-        else:
-            self._no_filters_label.show()
+                self._chips_layout.insertWidget(self._chips_layout.count() - 1, chip)  # Before the stretch
+                pool.append(chip)
+            chip.show()
+        for chip in pool[len(self._filters):]:
+            chip.hide()
+        self._chips_container.setUpdatesEnabled(True)
+
+        self._no_filters_label.setVisible(not self._filters)
 
     def _on_remove_filter(self, filter_: Filter):
         """Handle filter chip removal."""
@@ -500,15 +597,20 @@ class FilterOverlay(QDialog):
 
     def _update_suggestions(self):
         """Update the suggestions list based on input."""
-        self._suggestions_list.clear()
         text = self._input.text().strip()
+        suggestions = self._compute_suggestions(text)
+
+        # A single model reset; no per-row item objects
+        self._suggestions_model.setStringList(suggestions)
+        # Field hints for empty input start unselected
+        if text and suggestions:
+            self._suggestions_list.setCurrentIndex(self._suggestions_model.index(0))
 
+    def _compute_suggestions(self, text: str) -> list[str]:
+        """Get the suggestion strings for the given input text."""
         if not text:
             # Show field hints
-            for field in self.FILTER_FIELDS:
-                item = QListWidgetItem(f"{field}:")
-                self._suggestions_list.addItem(item)
-            return
+            return [f"{field}:" for field in self.FILTER_FIELDS]
 
         # For OR expressions, only suggest for the last part after |
         if "|" in text:
@@ -524,36 +626,31 @@ class FilterOverlay(QDialog):
             field = field.strip()
             value = value.strip()
 
-            if field in self.FILTER_FIELDS:
-                # Favorite is a boolean field, no value suggestions needed
-                if field == "favorite":
-                    item = QListWidgetItem(f"{prefix}favorite:yes")
-                    self._suggestions_list.addItem(item)
-                else:
-                    # Get unique values for this field
-                    values = self._get_unique_values(field)
-                    # Filter by partial match
-                    matches = [v for v in values if value.lower() in v.lower()][:20]
-
-                    for v in matches:
-                        item = QListWidgetItem(f"{prefix}{field}:{v}")
-                        self._suggestions_list.addItem(item)
-        else:
-            # Show matching fields
-            for field in self.FILTER_FIELDS:
-                if current_part in field:
-                    # For favorite, show with value since it's boolean
-                    if field == "favorite":
-                        item = QListWidgetItem(f"{prefix}favorite:yes")
-                    else:
-                        item = QListWidgetItem(f"{prefix}{field}:")
-                    self._suggestions_list.addItem(item)
-
-        if self._suggestions_list.count() > 0:
-            self._suggestions_list.setCurrentRow(0)
-
-    def _get_unique_values(self, field: str) -> list[str]:
-        """Get unique values for a field from tracks."""
+            if field not in self.FILTER_FIELDS:
+                return []
+            # Favorite is a boolean field, no value suggestions needed
+            if field == "favorite":
+                return [f"{prefix}favorite:yes"]
+            # Get unique values for this field
+            values, lowered = self._get_unique_values(field)
+            # Filter by partial match, stopping at the first 20 hits
+            needle = value.lower()
+            matches = islice((v for v, low in zip(values, lowered) if needle in low), 20)
+            return [f"{prefix}{field}:{v}" for v in matches]
+
+        # Show matching fields; favorite is shown with its value since it's boolean
+        return [
+            f"{prefix}favorite:yes" if field == "favorite" else f"{prefix}{field}:"
+            for field in self.FILTER_FIELDS
+            if current_part in field
+        ]
+
+    def _get_unique_values(self, field: str) -> tuple[list[str], list[str]]:
+        """Get sorted unique values for a field, and their lowercased forms (cached per library)."""
+        cached = self._unique_values.get(field)
+        if cached is not None:
+            return cached
+
         values = set()
         for track in self._tracks:
             val = getattr(track, field, "")
@@ -566,12 +663,21 @@ class FilterOverlay(QDialog):
                             values.add(part)
                 else:
                     values.add(str(val))
-        return sorted(values)
+        ordered = sorted(values)
+        cached = self._unique_values[field] = (ordered, [v.lower() for v in ordered])
+        return cached
 
-    def _on_suggestion_activated(self, item: QListWidgetItem):
+    def _current_suggestion(self) -> str | None:
+        """Get the text of the selected suggestion, if any."""
+        index = self._suggestions_list.currentIndex()
+        return index.data() if index.isValid() else None
+
+    def _on_suggestion_activated(self, index: QModelIndex):
         """Handle suggestion selection."""
-        text = item.text()
+        self._use_suggestion(index.data())
 
+    def _use_suggestion(self, text: str):
+        """Apply a suggestion: fill in a field prefix or add a full filter."""
         if text.endswith(":"):
             # Just a field, put it in input
             self._input.setText(text)
@@ -611,23 +717,70 @@ class FilterOverlay(QDialog):
         self._update_suggestions()
 
     def _update_match_count(self):
+        """Schedule a match count update (restarts on each edit)."""
+        self._match_timer.start()
+
+    def _do_update_match_count(self):
         """Update the matching tracks count."""
+        self._match_timer.stop()
         if not self._filters:
             self._match_label.setText(f"{len(self._tracks):,} tracks")
             return
 
-        count = sum(1 for t in self._tracks if self._track_matches(t))
+        count = len(self._matching_indices())
         self._match_label.setText(f"Matching: {count:,} tracks")
 
-    def _track_matches(self, track: Track) -> bool:
-        """Check if track matches all filters."""
-        return all(f.matches(track) for f in self._filters)
+    def _column(self, field: str) -> list[str]:
+        """Get the lowercased match text of a field for every track."""
+        column = self._columns.get(field)
+        if column is None:
+            column = self._columns[field] = [match_text(getattr(t, field, "")) for t in self._tracks]
+        return column
+
+    def _condition_predicate(self, condition: FilterCondition) -> Callable[[int], bool]:
+        """Get a test of a condition against a track index."""
+        tracks = self._tracks
+        if condition.field == "favorite":
+            return lambda i: tracks[i].favorite
+        if condition.is_year_range():
+            return lambda i: condition.matches_year_range(tracks[i].year)
+        column = self._column(condition.field)
+        value = condition.search_value
+        return lambda i: value in column[i]
+
+    def _matching_indices(self) -> Sequence[int]:
+        """Get indices of tracks matching all filters (do not mutate the result)."""
+        # Filters only ever narrow the match, so results for an unchanged leading
+        # run of filters are reused and only the filters after it are applied
+        stack = self._match_stack
+        keep = 0
+        while keep < min(len(stack), len(self._filters)) and stack[keep][0] is self._filters[keep]:
+            keep += 1
+        del stack[keep:]
+
+        indices: Sequence[int] = stack[-1][1] if stack else range(len(self._tracks))
+        for f in self._filters[keep:]:
+            indices = self._narrow(indices, f)
+            stack.append((f, indices))
+        return indices
+
+    def _narrow(self, indices: Sequence[int], filter_: Filter) -> list[int]:
+        """Get the subset of track indices that match a filter."""
+        condition = filter_.conditions[0]
+        if len(filter_.conditions) == 1 and condition.field != "favorite" and not condition.is_year_range():
+            # Single substring condition (the common case): test inline, no call per track
+            column = self._column(condition.field)
+            value = condition.search_value
+            return [i for i in indices if value in column[i]]
+        predicates = [self._condition_predicate(c) for c in filter_.conditions]
+        return [i for i in indices if any(p(i) for p in predicates)]
 
     def get_filtered_tracks(self) -> list[Track]:
         """Get tracks matching all filters."""
         if not self._filters:
             return self._tracks
-        return [t for t in self._tracks if self._track_matches(t)]
+        tracks = self._tracks
+        return [tracks[i] for i in self._matching_indices()]
 
     def _apply_filters(self):
         """Apply filters and close."""
@@ -668,9 +821,9 @@ class FilterOverlay(QDialog):
                     return True
                 # If input has partial text, try to use suggestion
                 if text:
-                    current = self._suggestions_list.currentItem()
+                    current = self._current_suggestion()
                     if current:
-                        self._on_suggestion_activated(current)
+                        self._use_suggestion(current)
                     return True
                 # If input is empty, apply current filters (even if empty - clears filters)
                 if not text:
@@ -686,18 +839,18 @@ class FilterOverlay(QDialog):
                 return True
             elif key == Qt.Key.Key_Tab:
                 # Autocomplete from suggestion
-                current = self._suggestions_list.currentItem()
+                current = self._current_suggestion()
                 if current:
-                    self._input.setText(current.text())
+                    self._input.setText(current)
                 return True
 
         return super().eventFilter(obj, event)
 
     def _move_selection(self, delta: int):
         """Move the selection up or down."""
-        current = self._suggestions_list.currentRow()
-        new_row = max(0, min(self._suggestions_list.count() - 1, current + delta))
-        self._suggestions_list.setCurrentRow(new_row)
+        current = self._suggestions_list.currentIndex().row()
+        new_row = max(0, min(self._suggestions_model.rowCount() - 1, current + delta))
+        self._suggestions_list.setCurrentIndex(self._suggestions_model.index(new_row))
 
     def keyPressEvent(self, event: QKeyEvent):
         """Handle key presses on the overlay itself."""
@@ -24,13 +24,14 @@ from player.core.playlist_manager import PlaylistManager
 from player.core.queue import PlaybackQueue
 from player.core.metadata import Track
 from player.core.mpris import create_mpris_service
+from player.core.track_table import TrackTable
 from player.theme.lainchan import get_stylesheet, BG_PRIMARY, BG_SECONDARY, TEXT_NORMAL, TEXT_MUTED, TEXT_DIM, ACCENT, BORDER
 from player.ui.player_bar import PlayerBar
 from player.ui.playlist_view import PlaylistView
 from player.ui.sidebar import Sidebar
 from player.ui.search_overlay import SearchOverlay
 from player.ui.filter_overlay import FilterOverlay, Filter, FilterCondition
-from player.ui.artist_overlay import ArtistOverlay
+from player.ui.artist_overlay import AlbumInfo, ArtistOverlay
 from player.ui.queue_panel import QueuePanel
 from player.utils.config import PlayerConfig, load_config, save_config
 
@@ -45,10 +46,10 @@ class LibraryScanWorker(QObject):
     def __init__(self, database: LibraryDatabase):
         super().__init__()
         self._scanner = LibraryScanner(database)
-        self._path: str | None = None
+        self._paths: list[Path] = []
 
-    def set_path(self, path: str):
-        self._path = path
+    def set_paths(self, paths: list[Path]):
+        self._paths = paths
 
     def load_cache(self):
         """Fast load from cache - no file I/O."""
@@ -57,10 +58,10 @@ class LibraryScanWorker(QObject):
 
     def scan(self):
         """Incremental scan for changes."""
-        if not self._path:
+        if not self._paths:
             return
         tracks, added, removed = self._scanner.scan_for_changes(
-            self._path,
+            self._paths,
             lambda cur, tot, status: self.progress.emit(cur, tot, status)
         )
         self.finished.emit(tracks, added, removed)
@@ -72,9 +73,15 @@ class LibraryScanWorker(QObject):
 class MainWindow(QMainWindow):
     """Main application window."""
 
-    def __init__(self, initial_path: str | None = None):
+    def __init__(self, initial_paths: list[Path] | None = None):
         super().__init__()
+
+        # Audio engine runs on its own thread so VLC calls never block the UI
+        self._audio_thread = QThread()
         self._audio = AudioEngine()
+        self._audio.moveToThread(self._audio_thread)
+        self._audio_thread.start()
+
         self._playlist = Playlist()
         self._queue = PlaybackQueue()
         self._config = load_config()
@@ -83,6 +90,7 @@ class MainWindow(QMainWindow):
 
         # Library tracks (full library, not filtered)
         self._library_tracks: list[Track] = []
+        self._library_table = TrackTable([])  # Column view of the library for sorting
 
         # Current view mode: None = library, str = playlist_id
         self._current_view: str | None = None
@@ -109,10 +117,10 @@ class MainWindow(QMainWindow):
         self._setup_mpris()
         self._restore_state()
 
-        # Load initial directory - prefer saved path, then provided path
-        load_path = self._config.last_library_path or initial_path
-        if load_path:
-            QTimer.singleShot(100, lambda: self._load_library(load_path))
+        # Load initial directories - prefer saved paths, then provided paths
+        load_paths = self._library_paths() or initial_paths
+        if load_paths:
+            QTimer.singleShot(100, lambda: self._load_library(load_paths))
 
     def _setup_ui(self):
         self.setWindowTitle("Wired")
@@ -268,13 +276,15 @@ class MainWindow(QMainWindow):
         self._audio.state_changed.connect(self._on_state_changed)
         self._audio.track_ended.connect(self._on_track_ended)
 
-        # Player bar signals
+        # Player bar signals. The engine lives on its own thread, so its commands are
+        # wrapped in lambdas to run on the GUI thread (a bound method would be queued
+        # to the engine thread, changing its playback state behind the GUI's back)
         self._player_bar.play_clicked.connect(self._play_current)
-        self._player_bar.pause_clicked.connect(self._audio.pause)
+        self._player_bar.pause_clicked.connect(lambda: self._audio.pause())
         self._player_bar.next_clicked.connect(self._play_next)
         self._player_bar.prev_clicked.connect(self._play_previous)
-        self._player_bar.seek_requested.connect(self._audio.seek)
-        self._player_bar.volume_changed.connect(self._audio.set_volume)
+        self._player_bar.seek_requested.connect(lambda position: self._audio.seek(position))
+        self._player_bar.volume_changed.connect(lambda volume: self._audio.set_volume(volume))
 
         # Playlist view signals
         self._playlist_view.track_activated.connect(self._play_track)
@@ -340,7 +350,7 @@ class MainWindow(QMainWindow):
         if state == "paused":
             self._audio.pause()  # Toggle resume
         elif state == "stopped" and self._current_track:
-            self._audio.play(str(self._current_track.filepath))
+            self._audio.play(self._current_track.filepath_str)
 
     def toggle_play_pause(self):
         """Toggle play/pause (MPRIS callback)."""
@@ -515,7 +525,7 @@ class MainWindow(QMainWindow):
     def _play_track_direct(self, track):
         """Play a specific track directly (from queue or search)."""
         self._current_track = track
-        self._audio.play(str(track.filepath))
+        self._audio.play(track.filepath_str)
         self._update_ui_for_track(track)
         self._sync_view_highlight()
         # Update queue panel (queued track was consumed, so upcoming preview updates)
@@ -601,14 +611,20 @@ class MainWindow(QMainWindow):
         prev_action.triggered.connect(self._play_previous)
         playback_menu.addAction(prev_action)
 
-    def _load_library(self, path: str):
+    def _library_paths(self) -> list[Path]:
+        """Get the saved library root directories (pipe-separated in config)."""
+        if not self._config.last_library_path:
+            return []
+        return [Path(p) for p in self._config.last_library_path.split("|")]
+
+    def _load_library(self, paths: list[Path]):
         """Load library - fast cache load, then background scan for changes."""
-        self._config.last_library_path = path
+        self._config.last_library_path = "|".join(str(p) for p in paths)
 
         # Setup worker and thread
         self._scan_thread = QThread()
         self._scan_worker = LibraryScanWorker(self._database)
-        self._scan_worker.set_path(path)
+        self._scan_worker.set_paths(paths)
         self._scan_worker.moveToThread(self._scan_thread)
 
         # Connect signals
@@ -624,10 +640,11 @@ class MainWindow(QMainWindow):
         """Handle fast cache load completion."""
         if tracks:
             self._library_tracks = tracks
+            self._library_table = TrackTable(tracks)
             self._apply_favorites_to_tracks()
-            self._playlist.clear()
-            self._playlist.add_tracks(tracks)
-            self._playlist.sort("album")
+            with self._playlist.batch_updates():
+                self._playlist.clear()
+                self._playlist.add_tracks(self._library_table.sorted_by("album", "track_number"))
             self._update_stats()
             self._restore_queue()
             self._restore_shuffle()
@@ -648,15 +665,16 @@ class MainWindow(QMainWindow):
     def _on_scan_finished(self, tracks: list[Track], added: int, removed: int):
         """Handle scan completion."""
         self._library_tracks = tracks
+        self._library_table = TrackTable(tracks)
         self._apply_favorites_to_tracks()
 
         # Update playlist with new/modified tracks
         if added > 0 or removed > 0:
             # Only update view if we're showing library
             if self._current_view is None:
-                self._playlist.clear()
-                self._playlist.add_tracks(tracks)
-                self._playlist.sort("album")
+                with self._playlist.batch_updates():
+                    self._playlist.clear()
+                    self._playlist.add_tracks(self._library_table.sorted_by("album", "track_number"))
             self._scan_label.setText(f"+{added} / -{removed} changes")
             # Clear after a delay
             QTimer.singleShot(3000, lambda: self._scan_label.setText(""))
@@ -664,6 +682,16 @@ class MainWindow(QMainWindow):
             self._scan_label.setText("Library up to date")
             QTimer.singleShot(2000, lambda: self._scan_label.setText(""))
 
+        # The scan rebuilt every Track; drop references to the cache-load copies
+        path_to_track = {t.filepath_str: t for t in tracks}
+        self._playlist.relink_tracks(path_to_track)
+        self._queue.relink_tracks(path_to_track)
+        if self._playback_tracks:
+            self._playback_tracks = [path_to_track.get(t.filepath_str, t) for t in self._playback_tracks]
+            self._update_queue_panel_playback()
+        if self._current_track:
+            self._current_track = path_to_track.get(self._current_track.filepath_str, self._current_track)
+
         self._update_stats()
         self._restore_queue()
         self._restore_shuffle()
@@ -680,7 +708,7 @@ class MainWindow(QMainWindow):
         """Apply favorite status from database to library tracks."""
         favorites = self._database.get_all_favorites()
         for track in self._library_tracks:
-            track.favorite = str(track.filepath) in favorites
+            track.favorite = track.filepath_str in favorites
 
     def _refresh_library(self):
         """Manually refresh the library."""
@@ -697,7 +725,7 @@ class MainWindow(QMainWindow):
             # Start a fresh scan (not from cache)
             self._scan_thread = QThread()
             self._scan_worker = LibraryScanWorker(self._database)
-            self._scan_worker.set_path(self._config.last_library_path)
+            self._scan_worker.set_paths(self._library_paths())
             self._scan_worker.moveToThread(self._scan_thread)
 
             self._scan_worker.progress.connect(self._on_scan_progress)
@@ -715,7 +743,7 @@ class MainWindow(QMainWindow):
         if path:
             # Clear database when switching libraries
             self._database.clear()
-            self._load_library(path)
+            self._load_library([Path(path)])
 
     def _open_folder_stateless(self):
         """Open a folder temporarily without caching (stateless)."""
@@ -749,7 +777,7 @@ class MainWindow(QMainWindow):
             self._build_playback_list(index)
             self._current_track = track
             self._playlist.set_current(index)  # Update view highlight
-            self._audio.play(str(track.filepath))
+            self._audio.play(track.filepath_str)
             self._update_ui_for_track(track)
             self._update_queue_panel_playback()
 
@@ -777,7 +805,7 @@ class MainWindow(QMainWindow):
         if self._audio.get_state() == "paused":
             self._audio.pause()  # Toggle resume
         elif self._current_track:
-            self._audio.play(str(self._current_track.filepath))
+            self._audio.play(self._current_track.filepath_str)
         elif len(self._playlist) > 0:
             self._play_track(0)
 
@@ -793,7 +821,7 @@ class MainWindow(QMainWindow):
                 self._playback_index = next_index
                 track = self._playback_tracks[next_index]
                 self._current_track = track
-                self._audio.play(str(track.filepath))
+                self._audio.play(track.filepath_str)
                 self._update_ui_for_track(track)
                 self._sync_view_highlight()
                 self._update_queue_panel_playback()
@@ -808,7 +836,7 @@ class MainWindow(QMainWindow):
             self._playback_index -= 1
             track = self._playback_tracks[self._playback_index]
             self._current_track = track
-            self._audio.play(str(track.filepath))
+            self._audio.play(track.filepath_str)
             self._update_ui_for_track(track)
             self._sync_view_highlight()
             self._update_queue_panel_playback()
@@ -906,12 +934,13 @@ class MainWindow(QMainWindow):
             return
 
         # Build a path-to-track lookup from playlist
-        path_to_track = {str(t.filepath): t for t in self._playlist.tracks}
+        path_to_track = {t.filepath_str: t for t in self._playlist.tracks}
 
         # Restore tracks that still exist in the library
-        for path in self._config.queue_paths:
-            if path in path_to_track:
-                self._queue.add_to_queue(path_to_track[path])
+        with self._queue.batch_updates():
+            for path in self._config.queue_paths:
+                if path in path_to_track:
+                    self._queue.add_to_queue(path_to_track[path])
 
         # Clear saved paths so we don't re-add on next library load
         self._config.queue_paths = []
@@ -949,8 +978,13 @@ class MainWindow(QMainWindow):
             self._scan_thread.quit()
             self._scan_thread.wait()
 
+        self._artist_overlay.shutdown()
+
         self._save_state()
-        self._audio.stop()
+        self._audio.stop(blocking=True)
+        self._audio_thread.quit()
+        self._audio_thread.wait()
+        self._database.close()
         event.accept()
 
     # --- Playlist management ---
@@ -1024,9 +1058,10 @@ class MainWindow(QMainWindow):
 
     def _finish_apply_view(self, tracks: list[Track]):
         """Complete view application."""
-        self._playlist.add_tracks(tracks)
         if self._current_view is None and not self._active_filters:
-            self._playlist.sort("album")
+            # Unfiltered library: reuse the table's cached album order
+            tracks = self._library_table.sorted_by("album", "track_number")
+        self._playlist.add_tracks(tracks)
         self._update_stats()
         self._update_filter_indicator()
         self._scan_label.setText("")
@@ -1203,14 +1238,14 @@ class MainWindow(QMainWindow):
         for index in track_indices:
             if 0 <= index < len(self._playlist):
                 track = self._playlist[index]
-                filepath = str(track.filepath)
+                filepath = track.filepath_str
                 # Toggle favorite status
                 new_status = not track.favorite
                 self._database.set_favorite(filepath, new_status)
                 track.favorite = new_status
                 # Also update in library tracks
                 for lib_track in self._library_tracks:
-                    if str(lib_track.filepath) == filepath:
+                    if lib_track.filepath_str == filepath:
                         lib_track.favorite = new_status
                         break
 
@@ -1224,11 +1259,11 @@ class MainWindow(QMainWindow):
         if self._current_view == "favorites":
             self._apply_current_view()
 
-    def _on_artist_album_selected(self, artist: str, album: str):
+    def _on_artist_album_selected(self, artist: str, album: AlbumInfo):
         """Handle album selection from artist overlay - apply filters."""
         self._active_filters = [
             Filter(conditions=[FilterCondition(field="artist", value=artist)]),
-            Filter(conditions=[FilterCondition(field="album", value=album)]),
+            Filter(conditions=[FilterCondition(field="album", value=album.name)]),
         ]
         self._apply_current_view()
 
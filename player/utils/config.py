@@ -22,7 +22,7 @@ class PlayerConfig:
     # Audio
     volume: int = 75
 
-    # Library
+    # Library (pipe-separated root directories)
     last_library_path: str = ""
 
     # Playback state